@@ -0,0 +1,24 @@
+"""Process-wide Anthropic client.
+
+anthropic.Anthropic() builds its own httpx client (connection pool, TLS
+context) on construction; sharing one instance lets the per-symbol analysis
+calls and post-trade reviews reuse keep-alive connections.
+"""
+
+from typing import TYPE_CHECKING
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    import anthropic
+
+_client: "anthropic.Anthropic | None" = None
+
+
+def get_client() -> "anthropic.Anthropic":
+    global _client
+    if _client is None:
+        import anthropic
+
+        _client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    return _client
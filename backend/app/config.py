@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     telegram_bot_token: str = ""
     telegram_chat_id: str = ""
     telegram_bot_enabled: bool = True
+    # Public URL of POST /api/telegram/webhook; empty = long-polling.
+    # Webhook mode also needs the secret, or the bot falls back to polling.
+    telegram_webhook_url: str = ""
+    telegram_webhook_secret: str = ""
 
     # AI Vision Analysis
     ai_vision_enabled: bool = True
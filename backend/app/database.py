@@ -1,14 +1,41 @@
 import asyncpg
+import orjson
 
 from app.config import settings
 
 _pool: asyncpg.Pool | None = None
 
 
+def _jsonb_encode(value) -> bytes:
+    # Binary jsonb wire format is a version byte followed by the JSON text
+    return b"\x01" + orjson.dumps(value)
+
+
+def _jsonb_decode(data: bytes):
+    return orjson.loads(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Per-connection setup: decode/encode jsonb with orjson."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_jsonb_encode,
+        decoder=_jsonb_decode,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
 async def get_pool() -> asyncpg.Pool:
     global _pool
     if _pool is None:
-        _pool = await asyncpg.create_pool(settings.database_url, min_size=2, max_size=10)
+        _pool = await asyncpg.create_pool(
+            settings.database_url,
+            min_size=2,
+            max_size=10,
+            statement_cache_size=1024,
+            init=_init_connection,
+        )
     return _pool
 
 
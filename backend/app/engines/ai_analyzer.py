@@ -21,6 +21,7 @@ import re
 import time
 from datetime import date, timedelta
 
+from app.anthropic_client import get_client
 from app.config import settings
 from app.database import get_pool
 
@@ -402,8 +403,6 @@ async def analyze_symbol_with_ai(symbol: str, week_start: date) -> dict | None:
     4. Parse & validate result
     5. Store in ai_analysis_results table
     """
-    import anthropic
-
     if not settings.anthropic_api_key:
         logger.error("LE_ANTHROPIC_API_KEY not set — cannot run AI analysis")
         return None
@@ -469,11 +468,12 @@ async def analyze_symbol_with_ai(symbol: str, week_start: date) -> dict | None:
     })
 
     # Call Claude Sonnet
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    client = get_client()
 
     start_time = time.time()
     try:
-        response = client.messages.create(
+        response = await asyncio.to_thread(
+            client.messages.create,
             model="claude-sonnet-4-5-20250929",
             max_tokens=2048,
             system=system_prompt,
@@ -579,9 +579,9 @@ async def store_ai_analysis(
             result["ai_score"],
             result["ai_confidence"],
             result["ai_bias"],
-            json.dumps(result.get("key_levels")) if result.get("key_levels") else None,
-            json.dumps(result.get("confluence")) if result.get("confluence") else None,
-            json.dumps(result.get("risk_factors")) if result.get("risk_factors") else None,
+            result.get("key_levels") or None,
+            result.get("confluence") or None,
+            result.get("risk_factors") or None,
             result.get("reasoning"),
             result.get("suggested_entry_window"),
             result.get("suggested_sl_pct"),
@@ -610,9 +610,5 @@ async def fetch_ai_analysis(symbol: str, week_start: date) -> dict | None:
         )
     if not row:
         return None
-    result = dict(row)
-    # Parse JSONB fields
-    for field in ("key_levels", "confluence", "risk_factors"):
-        if result[field] and isinstance(result[field], str):
-            result[field] = json.loads(result[field])
-    return result
+    # JSONB fields arrive already decoded (orjson codec registered in get_pool)
+    return dict(row)
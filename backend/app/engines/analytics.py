@@ -13,6 +13,7 @@ Groups H1 candles into daily bars, then calculates:
   - Composite TechnicalScore (0–100)
 """
 
+import asyncio
 import logging
 from datetime import date, timedelta
 
@@ -24,11 +25,14 @@ from app.database import get_pool
 from app.engines.backtest import run_backtest_for_symbol
 from app.engines.fundamental import score_symbol as fundamental_score_symbol
 
-# Lazy import to avoid circular dependency — used in run_full_analysis()
+# Lazy import to avoid circular dependency — used in _analyze_one()
 # from app.engines.ai_analyzer import analyze_symbol_with_ai, fetch_ai_analysis
 
 logger = logging.getLogger(__name__)
 
+# Symbols analyzed concurrently; stays below the asyncpg pool's max_size (10)
+_ANALYSIS_CONCURRENCY = 8
+
 
 async def fetch_candles(symbol: str) -> pd.DataFrame:
     """Fetch all H1 candles for a symbol from the database."""
@@ -419,6 +423,87 @@ async def _dynamic_min_score(pool, base_min_score: float) -> float:
     return base_min_score
 
 
+async def _analyze_one(symbol: str, week_start: date) -> tuple[dict, float]:
+    """
+    Technical analysis + backtest + fundamentals + AI vision for one symbol.
+    Returns (metrics or error dict, AI cost in USD).
+    """
+    # Lazy import to avoid circular dependency
+    from app.engines.ai_analyzer import analyze_symbol_with_ai, fetch_ai_analysis
+
+    try:
+        metrics = await analyze_symbol(symbol, week_start)
+        if metrics is None:
+            return {"symbol": symbol, "error": "No data"}, 0.0
+
+        # Run backtest and merge results
+        h1 = await fetch_candles(symbol)
+        bt = await run_backtest_for_symbol(symbol, h1, week_start)
+        if bt is not None:
+            metrics.update(bt)
+
+        # Compute fundamental score
+        fund_score = await fundamental_score_symbol(symbol, week_start)
+        metrics["fundamental_score"] = fund_score
+
+        # AI Vision Analysis (if enabled and screenshots available)
+        ai_result = None
+        ai_cost = 0.0
+        if settings.ai_vision_enabled:
+            # Try to run AI analysis (will skip if no screenshots)
+            ai_result = await analyze_symbol_with_ai(symbol, week_start)
+            if ai_result is None:
+                # Check if a previous analysis exists for this week
+                ai_result = await fetch_ai_analysis(symbol, week_start)
+
+        if ai_result is not None:
+            metrics["ai_score"] = ai_result["ai_score"]
+            metrics["ai_confidence"] = ai_result["ai_confidence"]
+            metrics["ai_bias"] = ai_result["ai_bias"]
+            ai_cost = ai_result.get("cost_usd") or 0.0
+
+        # Compute Final Score
+        # When backtest fails, use neutral 50 instead of 0
+        bt_score = bt["backtest_score"] if bt is not None else 50.0
+        metrics.setdefault("backtest_score", bt_score)
+
+        if ai_result is not None:
+            # NEW formula: AI(60%) + Backtest(25%) + Fundamental(15%)
+            ai_part = ai_result["ai_score"] * 0.60
+            bt_part = bt_score * 0.25
+            fund_part = fund_score * 0.15
+            metrics["final_score"] = round(ai_part + bt_part + fund_part, 1)
+            score_breakdown = (
+                f"AI:{ai_result['ai_score']:.0f} "
+                f"BT:{bt_score:.0f} "
+                f"F:{fund_score:.0f}"
+            )
+        else:
+            # Fallback: old formula Technical(50%) + Backtest(35%) + Fundamental(15%)
+            tech_part = metrics["technical_score"] * 0.50
+            bt_part = bt_score * 0.35
+            fund_part = fund_score * 0.15
+            metrics["final_score"] = round(tech_part + bt_part + fund_part, 1)
+            score_breakdown = (
+                f"T:{metrics['technical_score']:.0f} "
+                f"BT:{bt_score:.0f} "
+                f"F:{fund_score:.0f}"
+            )
+
+        ai_tag = f" [{metrics.get('ai_confidence', 'no-ai').upper()}]" if ai_result else " [NO-AI]"
+        logger.info(
+            "Analyzed %s: %s → final=%.1f%s",
+            symbol,
+            score_breakdown,
+            metrics["final_score"],
+            ai_tag,
+        )
+        return metrics, ai_cost
+    except Exception:
+        logger.exception("Failed to analyze %s", symbol)
+        return {"symbol": symbol, "error": "Analysis failed"}, 0.0
+
+
 async def run_full_analysis() -> list[dict]:
     """
     Run analytics + backtest for all markets (indices, commodities, and stocks).
@@ -437,86 +522,22 @@ async def run_full_analysis() -> list[dict]:
     # Build symbol→category lookup
     symbol_category = {row["symbol"]: row["category"] for row in symbols}
 
-    # Lazy import to avoid circular dependency
-    from app.engines.ai_analyzer import analyze_symbol_with_ai, fetch_ai_analysis
-
-    # Phase 1: Technical analysis + backtest + AI vision for each symbol
-    results = []
-    total_ai_cost = 0.0
-    for row in symbols:
-        symbol = row["symbol"]
-        try:
-            metrics = await analyze_symbol(symbol, week_start)
-            if metrics is None:
-                results.append({"symbol": symbol, "error": "No data"})
-                continue
-
-            # Run backtest and merge results
-            h1 = await fetch_candles(symbol)
-            bt = await run_backtest_for_symbol(symbol, h1, week_start)
-            if bt is not None:
-                metrics.update(bt)
-
-            # Compute fundamental score
-            fund_score = await fundamental_score_symbol(symbol, week_start)
-            metrics["fundamental_score"] = fund_score
-
-            # AI Vision Analysis (if enabled and screenshots available)
-            ai_result = None
-            if settings.ai_vision_enabled:
-                # Try to run AI analysis (will skip if no screenshots)
-                ai_result = await analyze_symbol_with_ai(symbol, week_start)
-                if ai_result is None:
-                    # Check if a previous analysis exists for this week
-                    ai_result = await fetch_ai_analysis(symbol, week_start)
-
-            if ai_result is not None:
-                metrics["ai_score"] = ai_result["ai_score"]
-                metrics["ai_confidence"] = ai_result["ai_confidence"]
-                metrics["ai_bias"] = ai_result["ai_bias"]
-                if ai_result.get("cost_usd"):
-                    total_ai_cost += ai_result["cost_usd"]
-
-            # Compute Final Score
-            # When backtest fails, use neutral 50 instead of 0
-            bt_score = bt["backtest_score"] if bt is not None else 50.0
-            metrics.setdefault("backtest_score", bt_score)
-
-            if ai_result is not None:
-                # NEW formula: AI(60%) + Backtest(25%) + Fundamental(15%)
-                ai_part = ai_result["ai_score"] * 0.60
-                bt_part = bt_score * 0.25
-                fund_part = fund_score * 0.15
-                metrics["final_score"] = round(ai_part + bt_part + fund_part, 1)
-                score_breakdown = (
-                    f"AI:{ai_result['ai_score']:.0f} "
-                    f"BT:{bt_score:.0f} "
-                    f"F:{fund_score:.0f}"
-                )
-            else:
-                # Fallback: old formula Technical(50%) + Backtest(35%) + Fundamental(15%)
-                tech_part = metrics["technical_score"] * 0.50
-                bt_part = bt_score * 0.35
-                fund_part = fund_score * 0.15
-                metrics["final_score"] = round(tech_part + bt_part + fund_part, 1)
-                score_breakdown = (
-                    f"T:{metrics['technical_score']:.0f} "
-                    f"BT:{bt_score:.0f} "
-                    f"F:{fund_score:.0f}"
-                )
-
-            results.append(metrics)
-            ai_tag = f" [{metrics.get('ai_confidence', 'no-ai').upper()}]" if ai_result else " [NO-AI]"
-            logger.info(
-                "Analyzed %s: %s → final=%.1f%s",
-                symbol,
-                score_breakdown,
-                metrics["final_score"],
-                ai_tag,
-            )
-        except Exception:
-            logger.exception("Failed to analyze %s", symbol)
-            results.append({"symbol": symbol, "error": "Analysis failed"})
+    # Phase 1: Technical analysis + backtest + AI vision, several symbols at once.
+    # The work is DB and Claude API round-trips, so overlapping it cuts wall time
+    # roughly by the concurrency factor; the semaphore keeps us inside the pool.
+    sem = asyncio.Semaphore(_ANALYSIS_CONCURRENCY)
+
+    async def _run(symbol: str) -> tuple[dict, float]:
+        async with sem:
+            return await _analyze_one(symbol, week_start)
+
+    # Per-symbol failures are caught inside _analyze_one; anything that escapes
+    # (pool closed, cancellation) cancels the siblings instead of orphaning them.
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_run(row["symbol"])) for row in symbols]
+    outcomes = [t.result() for t in tasks]
+    results = [r for r, _ in outcomes]
+    total_ai_cost = sum(cost for _, cost in outcomes)
 
     if total_ai_cost > 0:
         logger.info("Total AI analysis cost this run: $%.4f", total_ai_cost)
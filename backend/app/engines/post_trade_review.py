@@ -8,15 +8,26 @@ feed back into the AI analyzer's system prompt, creating a learning loop.
 Cost: ~$0.01 per review, ~20 trades/month = $0.20/month
 """
 
+import asyncio
 import logging
 import json
 from datetime import date, timedelta
 
+from app.anthropic_client import get_client
 from app.config import settings
 from app.database import get_pool
 
 logger = logging.getLogger(__name__)
 
+# Batches of newly inserted trade ids, one list per upload_trades call
+REVIEW_Q: asyncio.Queue[list[int]] = asyncio.Queue(maxsize=100)
+
+# At most this many reviews (DB + Haiku call) run at once
+_REVIEW_CONCURRENCY = 8
+
+# Ids reviewed recently; guards against overlapping batches re-queuing a trade
+_SEEN_MAX = 10_000
+
 
 async def review_closed_trade(trade_id: int):
     """Review a closed trade and store the insight.
@@ -96,10 +107,12 @@ AI Analysis at Entry:
 Provide ONE specific, actionable insight (2-3 sentences max) about what can be learned from this trade outcome relative to the AI confidence at entry. Focus on pattern recognition: does this market tend to perform better/worse at certain confidence levels, or conditions?"""
 
     try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        client = get_client()
 
-        response = client.messages.create(
+        # Sync SDK call; run it off the event loop so review_worker's
+        # concurrent reviews actually overlap
+        response = await asyncio.to_thread(
+            client.messages.create,
             model="claude-haiku-4-5-20251001",
             max_tokens=200,
             messages=[{"role": "user", "content": prompt}],
@@ -143,6 +156,30 @@ Provide ONE specific, actionable insight (2-3 sentences max) about what can be l
     )
 
 
+async def review_worker():
+    """Drain REVIEW_Q, reviewing each batch with bounded concurrency."""
+    sem = asyncio.Semaphore(_REVIEW_CONCURRENCY)
+    seen: set[int] = set()
+
+    async def _one(trade_id: int):
+        async with sem:
+            try:
+                await review_closed_trade(trade_id)
+            except Exception as e:
+                logger.error("Post-trade review failed for trade %d: %s", trade_id, e)
+
+    while True:
+        ids = await REVIEW_Q.get()
+        try:
+            if len(seen) > _SEEN_MAX:
+                seen.clear()
+            batch = [tid for tid in dict.fromkeys(ids) if tid not in seen]
+            seen.update(batch)
+            await asyncio.gather(*map(_one, batch))
+        finally:
+            REVIEW_Q.task_done()
+
+
 async def get_recent_insights(symbol: str, limit: int = 5) -> list[dict]:
     """Fetch recent post-trade review insights for a symbol."""
     pool = await get_pool()
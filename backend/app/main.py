@@ -4,17 +4,22 @@ import time
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import settings
 from app.database import close_pool, get_pool
+from app.engines.post_trade_review import review_worker
 from app.logging_config import setup_logging
-from app.routers import analytics, candles, config, fundamental, health, history, markets, results, screenshots, trades
+from app.telegram import close_session
+from app.routers import analytics, candles, config, fundamental, health, history, markets, results, screenshots, telegram, trades
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="LongEntry Market Scanner", version="1.0.0")
 
+_review_task: asyncio.Task | None = None
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Tighten in production
@@ -22,6 +27,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Heatmap / history / trades JSON is large and highly repetitive
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -42,8 +50,11 @@ async def log_requests(request: Request, call_next):
 
 @app.on_event("startup")
 async def startup():
+    global _review_task
     logger.info("Starting LongEntry Market Scanner API")
     await get_pool()
+    screenshots.warm_up_image_codec()
+    _review_task = asyncio.create_task(review_worker())
 
     # Start Telegram bot if configured
     if (
@@ -78,6 +89,10 @@ async def shutdown():
     except Exception as e:
         logger.error("Error stopping Telegram bot: %s", e)
 
+    if _review_task is not None:
+        _review_task.cancel()
+
+    await close_session()
     await close_pool()
 
 
@@ -91,3 +106,4 @@ app.include_router(fundamental.router, prefix="/api")
 app.include_router(results.router, prefix="/api")
 app.include_router(trades.router, prefix="/api")
 app.include_router(screenshots.router, prefix="/api")
+app.include_router(telegram.router, prefix="/api")
@@ -0,0 +1,52 @@
+"""Validate JSON request bodies straight from bytes.
+
+EA uploads (candles, trades) can be large. Declaring them as FastAPI body
+parameters means json.loads -> Python dicts -> model validation; here
+pydantic-core parses and validates the raw bytes in a single pass instead.
+"""
+
+from typing import TypeVar
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _inline_schema(model: type[BaseModel]) -> dict:
+    """JSON schema for a model with its $defs references inlined."""
+    schema = model.model_json_schema(by_alias=True)
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                return resolve(defs[ref.removeprefix("#/$defs/")])
+            return {k: resolve(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [resolve(v) for v in node]
+        return node
+
+    return resolve(schema)
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict:
+    """openapi_extra documenting a body that is parsed by parse_json_body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema(model)}},
+        },
+    }
+
+
+async def parse_json_body(request: Request, model: type[M]) -> M:
+    """Validate the request body as `model`; errors become the usual 422."""
+    try:
+        return model.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
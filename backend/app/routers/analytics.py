@@ -1,7 +1,8 @@
 import logging
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import TypeAdapter
 
 from app.auth import require_api_key
 from app.database import get_pool
@@ -11,11 +12,22 @@ from app.engines.analytics import (
     run_full_analysis,
     store_analysis,
 )
-from app.schemas.analytics import AnalysisSummary, RunAnalysisResponse, SymbolAnalytics
+from app.schemas.analytics import (
+    AnalysisError,
+    AnalysisSummary,
+    RunAnalysisResponse,
+    SymbolAnalytics,
+)
 
 router = APIRouter(tags=["analytics"])
 logger = logging.getLogger(__name__)
 
+_SUMMARY_LIST = TypeAdapter(list[AnalysisSummary])
+
+# (week_start, weekly_analysis version, universe size) -> serialized body.
+# Every committed write to weekly_analysis bumps the version (migration 012).
+_list_cache: tuple[tuple, bytes] | None = None
+
 
 _ANALYSIS_COLS = """
     symbol, week_start, technical_score,
@@ -64,8 +76,21 @@ async def list_analytics():
     Uses DISTINCT ON to always return the most recent row per symbol,
     preventing gaps when the week changes but analysis hasn't run yet.
     """
+    global _list_cache
     week_start = get_current_week_start()
     pool = await get_pool()
+    async with pool.acquire() as conn:
+        stamp = await conn.fetchrow(
+            """
+            SELECT version,
+                   (SELECT COUNT(*) FROM markets WHERE is_in_universe = true) AS market_count
+            FROM weekly_analysis_version
+            """
+        )
+    key = (week_start, stamp["version"], stamp["market_count"])
+    if _list_cache is not None and _list_cache[0] == key:
+        return Response(content=_list_cache[1], media_type="application/json")
+
     async with pool.acquire() as conn:
         rows = await conn.fetch(
             f"""
@@ -78,10 +103,7 @@ async def list_analytics():
         )
 
     # If not all markets have data for this week, get most recent per symbol
-    async with pool.acquire() as conn:
-        market_count = await conn.fetchval(
-            "SELECT COUNT(*) FROM markets WHERE is_in_universe = true"
-        )
+    market_count = stamp["market_count"]
     if len(rows) < (market_count or 14):
         async with pool.acquire() as conn:
             rows = await conn.fetch(
@@ -94,7 +116,9 @@ async def list_analytics():
                 """
             )
 
-    return [_row_to_summary(r) for r in rows]
+    body = _SUMMARY_LIST.dump_json([_row_to_summary(r) for r in rows])
+    _list_cache = (key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/analytics/{symbol}", response_model=SymbolAnalytics)
@@ -153,12 +177,20 @@ async def trigger_analysis(api_key: str = Depends(require_api_key)):
 
     results = await run_full_analysis()
 
-    analyzed = sum(1 for r in results if "error" not in r)
-    failed = sum(1 for r in results if "error" in r)
+    # Engine dicts carry extra metrics and numpy scalars; validation keeps
+    # the summary fields and coerces them to plain Python types.
+    summaries = []
+    errors = []
+    for r in results:
+        if "error" in r:
+            errors.append(AnalysisError(symbol=r["symbol"], error=r["error"]))
+        else:
+            summaries.append(AnalysisSummary.model_validate(r))
 
     return RunAnalysisResponse(
         week_start=week_start,
-        analyzed=analyzed,
-        failed=failed,
-        results=results,
+        analyzed=len(summaries),
+        failed=len(errors),
+        results=summaries,
+        errors=errors,
     )
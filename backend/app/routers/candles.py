@@ -1,10 +1,11 @@
 import logging
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 
 from app.config import settings
 from app.database import get_pool
-from app.schemas.candle import CandleUploadRequest, CandleUploadResponse
+from app.request_body import json_body_openapi, parse_json_body
+from app.schemas.candle import CandleData, CandleUploadRequest, CandleUploadResponse
 
 router = APIRouter(tags=["candles"])
 logger = logging.getLogger(__name__)
@@ -46,12 +47,19 @@ async def get_candles(symbol: str, limit: int = Query(default=500, ge=1, le=2000
     return candles
 
 
-@router.post("/candles", response_model=CandleUploadResponse)
-async def upload_candles(payload: CandleUploadRequest):
+@router.post(
+    "/candles",
+    response_model=CandleUploadResponse,
+    openapi_extra=json_body_openapi(CandleUploadRequest),
+)
+async def upload_candles(request: Request):
     """Receive H1 candle data from DataSender.
 
     Authentication is via apiKey in the JSON body (MQL5 WebRequest limitation).
     """
+    # Up to 20k candles: validated from the raw bytes in one pass
+    payload = await parse_json_body(request, CandleUploadRequest)
+
     if not settings.verify_api_key(payload.api_key):
         raise HTTPException(status_code=401, detail="Invalid API key")
 
@@ -67,27 +75,45 @@ async def upload_candles(payload: CandleUploadRequest):
                 status_code=400, detail=f"Unknown symbol: {payload.symbol}"
             )
 
-        # Insert candles, counting actual inserts via status string
-        inserted = 0
-        for candle in payload.candles:
-            status = await conn.execute(
+        # Insert all candles in one statement from column arrays;
+        # conflicts (already stored bars) are skipped and not counted.
+        columns = CandleData.batch_to_numpy(payload.candles)
+        status = await conn.execute(
+            """
+            INSERT INTO candles (symbol, timeframe, open_time, open, high, low, close, volume)
+            SELECT $1, $2, t.*
+            FROM unnest($3::timestamp[], $4::float8[], $5::float8[],
+                        $6::float8[], $7::float8[], $8::float8[]) AS t
+            ON CONFLICT (symbol, timeframe, open_time) DO NOTHING
+            """,
+            payload.symbol,
+            payload.timeframe,
+            columns["time"].tolist(),
+            columns["open"].tolist(),
+            columns["high"].tolist(),
+            columns["low"].tolist(),
+            columns["close"].tolist(),
+            columns["volume"].tolist(),
+        )
+        # asyncpg returns "INSERT 0 <rows inserted>"
+        inserted = int(status.rsplit(" ", 1)[-1])
+
+        # Keep the per-symbol latest price current for /api/markets
+        if len(columns):
+            newest = columns[columns["time"].argmax()]
+            await conn.execute(
                 """
-                INSERT INTO candles (symbol, timeframe, open_time, open, high, low, close, volume)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                ON CONFLICT (symbol, timeframe, open_time) DO NOTHING
+                INSERT INTO latest_candles (symbol, close, open_time)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (symbol) DO UPDATE SET
+                    close = EXCLUDED.close,
+                    open_time = EXCLUDED.open_time
+                WHERE latest_candles.open_time < EXCLUDED.open_time
                 """,
                 payload.symbol,
-                payload.timeframe,
-                candle.time,
-                candle.open,
-                candle.high,
-                candle.low,
-                candle.close,
-                candle.volume,
+                newest["close"].item(),
+                newest["time"].item(),
             )
-            # asyncpg returns "INSERT 0 1" on insert, "INSERT 0 0" on conflict
-            if status.endswith("1"):
-                inserted += 1
 
     duplicates = len(payload.candles) - inserted
 
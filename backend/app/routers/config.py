@@ -8,6 +8,7 @@ from app.config import settings
 from app.database import get_pool
 from app.schemas.market import (
     ApplyRankingResponse,
+    MarketConfigCore,
     MarketConfigResponse,
     MaxActiveRequest,
     MaxActiveResponse,
@@ -272,7 +273,7 @@ async def get_config(symbol: str):
     )
 
 
-@router.post("/override/{symbol}", response_model=MarketConfigResponse)
+@router.post("/override/{symbol}", response_model=MarketConfigCore)
 async def override_market(
     symbol: str,
     body: OverrideRequest,
@@ -327,7 +328,7 @@ async def override_market(
         row = await conn.fetchrow(
             """
             SELECT is_active, opt_entry_hour, opt_entry_minute,
-                   opt_sl_percent, opt_tp_percent, ai_confidence
+                   opt_sl_percent, opt_tp_percent
             FROM weekly_analysis
             WHERE symbol = $1 AND week_start = $2
             """,
@@ -335,9 +336,10 @@ async def override_market(
             week_start,
         )
 
+    # The dashboard only needs the core parameters back; the smart
+    # position fields are computed for the EA in get_config.
     if row is None:
-        smart = _calculate_smart_params(None, 0.0, 0.0)
-        return MarketConfigResponse(
+        return MarketConfigCore(
             symbol=symbol,
             active=False,
             entry_hour=0,
@@ -345,21 +347,9 @@ async def override_market(
             sl_percent=0.0,
             tp_percent=0.0,
             week_start=str(week_start),
-            tp1_close_pct=smart["tp1_close_pct"],
-            tp2_percent=smart["tp2_percent"],
-            ai_confidence=smart["ai_confidence"],
-            use_trailing_stop=smart["use_trailing_stop"],
-            trailing_stop_distance=smart["trailing_stop_distance"],
         )
 
-    # Calculate smart params based on AI confidence
-    smart = _calculate_smart_params(
-        row["ai_confidence"],
-        row["opt_sl_percent"] or 0,
-        row["opt_tp_percent"] or 0
-    )
-
-    return MarketConfigResponse(
+    return MarketConfigCore(
         symbol=symbol,
         active=row["is_active"],
         entry_hour=row["opt_entry_hour"] or 0,
@@ -367,9 +357,4 @@ async def override_market(
         sl_percent=row["opt_sl_percent"] or 0.0,
         tp_percent=row["opt_tp_percent"] or 0.0,
         week_start=str(week_start),
-        tp1_close_pct=smart["tp1_close_pct"],
-        tp2_percent=smart["tp2_percent"],
-        ai_confidence=smart["ai_confidence"],
-        use_trailing_stop=smart["use_trailing_stop"],
-        trailing_stop_distance=smart["trailing_stop_distance"],
     )
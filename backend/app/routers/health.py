@@ -1,7 +1,7 @@
 import logging
 from datetime import date, timedelta
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from app.database import get_pool
 
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(response: Response):
     """
     System health check — returns status of each subsystem.
 
@@ -74,4 +74,9 @@ async def health_check():
     elif not checks.get("candles") or not checks.get("analysis"):
         health["status"] = "warning"
 
+    # Only a healthy result may be cached; a warning/error must be re-checked
+    # on every poll so monitors see the outage and the recovery at once.
+    response.headers["Cache-Control"] = (
+        "public, max-age=60" if health["status"] == "ok" else "no-store"
+    )
     return health
@@ -1,8 +1,11 @@
 import logging
+from collections import OrderedDict
 from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from app.database import get_pool
 from app.engines.analytics import fetch_candles
@@ -16,15 +19,50 @@ from app.engines.backtest import (
 )
 from app.schemas.history import (
     DrawdownInfo,
-    HeatmapCell,
     HeatmapResponse,
-    HourReturn,
     WeeklyScoreRecord,
 )
 
-router = APIRouter(tags=["history"])
+router = APIRouter(tags=["history"], default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+# (symbol, latest H1 open_time, candle count) -> (arrays, valid_hours)
+# Candles only change on upload, so repeated heatmap requests reuse the
+# prepared numpy arrays instead of refetching and reconverting ~2 years of H1.
+_ARRAYS_CACHE: "OrderedDict[tuple, tuple[dict, list[int]]]" = OrderedDict()
+_ARRAYS_CACHE_MAX = 64
+
+
+async def _get_arrays(symbol: str) -> tuple[dict, list[int]] | None:
+    """Return (arrays, valid_hours) for a symbol, memoized on its latest candle."""
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        stamp = await conn.fetchrow(
+            """
+            SELECT MAX(open_time) AS latest, COUNT(*) AS n
+            FROM candles
+            WHERE symbol = $1 AND timeframe = 'H1'
+            """,
+            symbol,
+        )
+    if stamp["latest"] is None:
+        return None
+
+    key = (symbol, stamp["latest"], stamp["n"])
+    cached = _ARRAYS_CACHE.get(key)
+    if cached is not None:
+        _ARRAYS_CACHE.move_to_end(key)
+        return cached
+
+    h1 = await fetch_candles(symbol)
+    if h1.empty:
+        return None
+    entry = (_prepare_arrays(h1), get_valid_entry_hours(h1, symbol))
+    _ARRAYS_CACHE[key] = entry
+    if len(_ARRAYS_CACHE) > _ARRAYS_CACHE_MAX:
+        _ARRAYS_CACHE.popitem(last=False)
+    return entry
+
 
 @router.get("/analytics/history/{symbol}", response_model=list[WeeklyScoreRecord])
 async def get_symbol_history(symbol: str, weeks: int = Query(default=52, le=200)):
@@ -52,7 +90,7 @@ async def get_symbol_history(symbol: str, weeks: int = Query(default=52, le=200)
             weeks,
         )
 
-    return [WeeklyScoreRecord(**dict(r)) for r in rows]
+    return [WeeklyScoreRecord.model_construct(**dict(r)) for r in rows]
 
 
 @router.get("/analytics/history", response_model=list[WeeklyScoreRecord])
@@ -74,7 +112,7 @@ async def get_all_history(weeks: int = Query(default=12, le=52)):
             cutoff,
         )
 
-    return [WeeklyScoreRecord(**dict(r)) for r in rows]
+    return [WeeklyScoreRecord.model_construct(**dict(r)) for r in rows]
 
 
 @router.get("/backtest/heatmap/{symbol}", response_model=HeatmapResponse)
@@ -101,16 +139,15 @@ async def get_heatmap(symbol: str):
             symbol,
         )
 
-    # Fetch candle data
-    h1 = await fetch_candles(symbol)
-    if h1.empty:
+    # Candle arrays (cached until new candles arrive)
+    prepared = await _get_arrays(symbol)
+    if prepared is None:
         raise HTTPException(
             status_code=404, detail=f"No candle data for {symbol}"
         )
 
     spread = TYPICAL_SPREADS.get(symbol, 1.0)
-    arrays = _prepare_arrays(h1)
-    valid_hours = get_valid_entry_hours(h1, symbol)
+    arrays, valid_hours = prepared
 
     if not valid_hours:
         raise HTTPException(
@@ -122,20 +159,18 @@ async def get_heatmap(symbol: str):
         opt_hour = valid_hours[len(valid_hours) // 2]
 
     # Build SL x TP heatmap grid at the optimal entry hour
-    grid = []
-    for sl_pct in SL_GRID:
-        for tp_pct in TP_GRID:
+    shape = (len(SL_GRID), len(TP_GRID))
+    total_return = np.empty(shape, dtype=np.float32)
+    win_rate = np.empty(shape, dtype=np.float32)
+    profit_factor = np.empty(shape, dtype=np.float32)
+    total_trades = np.empty(shape, dtype=np.int32)
+    for i, sl_pct in enumerate(SL_GRID):
+        for j, tp_pct in enumerate(TP_GRID):
             result = simulate_trades(arrays, opt_hour, sl_pct, tp_pct, spread)
-            grid.append(
-                HeatmapCell(
-                    sl_pct=sl_pct,
-                    tp_pct=tp_pct,
-                    total_return=result["total_return"],
-                    win_rate=result["win_rate"],
-                    profit_factor=result["profit_factor"],
-                    total_trades=result["total_trades"],
-                )
-            )
+            total_return[i, j] = result["total_return"]
+            win_rate[i, j] = result["win_rate"]
+            profit_factor[i, j] = result["profit_factor"]
+            total_trades[i, j] = result["total_trades"]
 
     # Build entry-hour returns (at median SL/TP)
     mid_sl = SL_GRID[len(SL_GRID) // 2]
@@ -144,18 +179,29 @@ async def get_heatmap(symbol: str):
     for hour in valid_hours:
         result = simulate_trades(arrays, hour, mid_sl, mid_tp, spread)
         entry_hour_returns.append(
-            HourReturn(
-                hour=hour,
-                total_return=result["total_return"],
-                win_rate=result["win_rate"],
-            )
+            {
+                "hour": hour,
+                "total_return": result["total_return"],
+                "win_rate": result["win_rate"],
+            }
         )
 
-    return HeatmapResponse(
-        symbol=symbol,
-        entry_hour=opt_hour,
-        grid=grid,
-        entry_hour_returns=entry_hour_returns,
+    # Shaped as HeatmapResponse; ORJSONResponse serializes the numpy
+    # matrices directly (OPT_SERIALIZE_NUMPY) with no per-cell objects.
+    return ORJSONResponse(
+        {
+            "symbol": symbol,
+            "entry_hour": opt_hour,
+            "grid": {
+                "sl_pcts": SL_GRID,
+                "tp_pcts": TP_GRID,
+                "total_return": total_return,
+                "win_rate": win_rate,
+                "profit_factor": profit_factor,
+                "total_trades": total_trades,
+            },
+            "entry_hour_returns": entry_hour_returns,
+        }
     )
 
 
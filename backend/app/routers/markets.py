@@ -1,14 +1,28 @@
-from fastapi import APIRouter
+import time
+
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 
 from app.database import get_pool
 from app.schemas.market import MarketInfo
 
-router = APIRouter(tags=["markets"])
+router = APIRouter(tags=["markets"], default_response_class=ORJSONResponse)
+
+# The dashboard polls /markets; latest prices only move at candle-close cadence
+_MARKETS_TTL_SECONDS = 5.0
+_CACHE_CONTROL = "public, max-age=60"
+_markets_cache: tuple[float, list[MarketInfo]] | None = None
 
 
 @router.get("/markets", response_model=list[MarketInfo])
-async def list_markets():
+async def list_markets(response: Response):
     """Return all 14 markets with latest candle price."""
+    global _markets_cache
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    now = time.monotonic()
+    if _markets_cache is not None and now - _markets_cache[0] < _MARKETS_TTL_SECONDS:
+        return _markets_cache[1]
+
     pool = await get_pool()
     async with pool.acquire() as conn:
         rows = await conn.fetch(
@@ -17,27 +31,14 @@ async def list_markets():
                 m.symbol,
                 m.name,
                 m.category,
-                c.close AS latest_price,
-                c.open_time AS latest_time
+                l.close AS latest_price,
+                l.open_time AS latest_time
             FROM markets m
-            LEFT JOIN LATERAL (
-                SELECT close, open_time
-                FROM candles
-                WHERE candles.symbol = m.symbol
-                ORDER BY open_time DESC
-                LIMIT 1
-            ) c ON true
+            LEFT JOIN latest_candles l ON l.symbol = m.symbol
             WHERE m.is_in_universe = true
             ORDER BY m.category, m.symbol
             """
         )
-    return [
-        MarketInfo(
-            symbol=r["symbol"],
-            name=r["name"],
-            category=r["category"],
-            latest_price=r["latest_price"],
-            latest_time=r["latest_time"],
-        )
-        for r in rows
-    ]
+    markets = [MarketInfo.model_construct(**dict(r)) for r in rows]
+    _markets_cache = (now, markets)
+    return markets
@@ -1,6 +1,9 @@
 import logging
+from itertools import groupby
+from operator import itemgetter
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database import get_pool
@@ -10,9 +13,16 @@ from app.schemas.results import (
     WeeklyResultSummary,
 )
 
-router = APIRouter(tags=["results"])
+router = APIRouter(tags=["results"], default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+_week_start = itemgetter("week_start")
+_trades_taken = itemgetter("trades_taken")
+_wins = itemgetter("wins")
+_losses = itemgetter("losses")
+_pnl = itemgetter("total_pnl_percent")
+_was_active = itemgetter("was_active")
+
 
 @router.post("/results", response_model=TradeResultResponse)
 async def upload_result(payload: TradeResultUpload):
@@ -85,33 +95,19 @@ async def list_results():
             """
         )
 
-    # Group by week
-    weeks: dict = {}
-    for r in rows:
-        ws = r["week_start"]
-        if ws not in weeks:
-            weeks[ws] = []
-        weeks[ws].append(TradeResultResponse(
-            symbol=r["symbol"],
-            week_start=r["week_start"],
-            trades_taken=r["trades_taken"],
-            wins=r["wins"],
-            losses=r["losses"],
-            total_pnl_percent=r["total_pnl_percent"],
-            was_active=r["was_active"],
-        ))
-
+    # Rows arrive ordered by week, so group them in one pass. They are
+    # trusted DB data and go straight to orjson without model validation.
     summaries = []
-    for ws in sorted(weeks, reverse=True):
-        results = weeks[ws]
-        summaries.append(WeeklyResultSummary(
-            week_start=ws,
-            total_trades=sum(r.trades_taken for r in results),
-            total_wins=sum(r.wins for r in results),
-            total_losses=sum(r.losses for r in results),
-            total_pnl_percent=round(sum(r.total_pnl_percent for r in results), 2),
-            active_markets=sum(1 for r in results if r.was_active),
-            results=results,
-        ))
+    for ws, group in groupby(rows, key=_week_start):
+        results = [dict(r) for r in group]
+        summaries.append({
+            "week_start": ws,
+            "total_trades": sum(map(_trades_taken, results)),
+            "total_wins": sum(map(_wins, results)),
+            "total_losses": sum(map(_losses, results)),
+            "total_pnl_percent": round(sum(map(_pnl, results)), 2),
+            "active_markets": sum(1 for r in results if _was_active(r)),
+            "results": results,
+        })
 
-    return summaries
+    return ORJSONResponse(summaries)
@@ -5,15 +5,22 @@ The ScreenshotSender EA uploads D1/H4/H1/M5 chart screenshots every Friday.
 These are stored as JPEG files and used by the AI analysis engine on Saturday.
 """
 
-import base64
+import errno
+import hashlib
 import logging
 import os
+import uuid
 from datetime import datetime
+from io import BytesIO
 
-from fastapi import APIRouter, HTTPException, Query
+import aiofiles
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database import get_pool
+from app.request_body import json_body_openapi, parse_json_body
 from app.schemas.screenshot import (
     ScreenshotInfo,
     ScreenshotListResponse,
@@ -21,11 +28,22 @@ from app.schemas.screenshot import (
     ScreenshotUploadResponse,
 )
 
-router = APIRouter(tags=["screenshots"])
+try:
+    from PIL import Image
+except ImportError:  # Pillow not installed — screenshots are stored as-is
+    Image = None
+
+router = APIRouter(tags=["screenshots"], default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 REQUIRED_TIMEFRAMES = {"D1", "H4", "H1", "M5"}
 
+# os.link errors that mean "no hardlinks here" rather than a real failure
+_NO_HARDLINK = {errno.EXDEV, errno.EPERM, errno.EMLINK}
+
+# Directories already created by this process (skips makedirs syscalls)
+_MKDIR_CACHE: set[str] = set()
+
 
 def _screenshot_dir(week_start) -> str:
     """Build directory path: /opt/longentry/screenshots/2026/week_8/"""
@@ -39,13 +57,88 @@ def _screenshot_path(week_start, symbol: str, timeframe: str) -> str:
     return os.path.join(_screenshot_dir(week_start), f"{symbol}_{timeframe}.jpg")
 
 
-@router.post("/screenshots", response_model=ScreenshotUploadResponse)
-async def upload_screenshot(payload: ScreenshotUploadRequest):
+def _ensure_dir(path: str) -> None:
+    """os.makedirs(path, exist_ok=True), once per directory per process."""
+    if path not in _MKDIR_CACHE:
+        os.makedirs(path, exist_ok=True)
+        _MKDIR_CACHE.add(path)
+
+
+def _blob_path(digest: str) -> str:
+    """Content-addressed blob path: /opt/longentry/screenshots/blobs/ab/cd/<sha256>.jpg"""
+    return os.path.join(
+        settings.screenshot_dir, "blobs", digest[:2], digest[2:4], f"{digest}.jpg"
+    )
+
+
+async def _store_content_addressed(image_data: bytes, file_path: str) -> str:
+    """Write image bytes once per unique content and hardlink file_path to it.
+
+    Re-uploads of an identical chart only create a link instead of rewriting
+    the JPEG. Returns the SHA-256 hex digest of the image.
+    """
+    digest = hashlib.sha256(image_data).hexdigest()
+    blob = _blob_path(digest)
+
+    if not os.path.exists(blob):
+        _ensure_dir(os.path.dirname(blob))
+        # Unique per upload: concurrent uploads of one chart mustn't share it
+        tmp = f"{blob}.{uuid.uuid4().hex}.tmp"
+        async with aiofiles.open(tmp, "xb") as f:
+            await f.write(image_data)
+        os.replace(tmp, blob)
+
+    # Link under a temp name, then rename over the readable path (atomic swap)
+    _ensure_dir(os.path.dirname(file_path))
+    tmp_link = f"{file_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.link(blob, tmp_link)
+    except OSError as e:
+        if e.errno not in _NO_HARDLINK:
+            raise
+        # Hardlinks unsupported (e.g. blobs on another filesystem) — plain
+        # copy. "xb" never opens an existing path, which could be the blob.
+        async with aiofiles.open(tmp_link, "xb") as f:
+            await f.write(image_data)
+    os.replace(tmp_link, file_path)
+    return digest
+
+
+def warm_up_image_codec() -> None:
+    """Round-trip a tiny JPEG so Pillow loads its codec plugins at startup,
+    not on the first screenshot upload."""
+    if Image is None:
+        return
+    buf = BytesIO()
+    Image.new("RGB", (8, 8)).save(buf, format="JPEG", quality=settings.screenshot_quality)
+    Image.open(BytesIO(buf.getvalue())).convert("RGB").save(
+        BytesIO(), format="JPEG", quality=settings.screenshot_quality
+    )
+
+
+@router.post(
+    "/screenshots",
+    response_model=ScreenshotUploadResponse,
+    openapi_extra=json_body_openapi(ScreenshotUploadRequest),
+)
+async def upload_screenshot(request: Request):
     """Receive a chart screenshot from ScreenshotSender EA.
 
     Authentication is via apiKey in the JSON body (MQL5 WebRequest limitation).
     Image is sent as base64-encoded JPEG.
     """
+    try:
+        payload = await parse_json_body(request, ScreenshotUploadRequest)
+    except RequestValidationError as e:
+        # Undecodable image data stays a 400, and the multi-MB payload is
+        # not echoed back as the "input" of a 422
+        if any(
+            err["loc"] == ("body", "image_base64") and err["type"] == "value_error"
+            for err in e.errors()
+        ):
+            raise HTTPException(status_code=400, detail="Invalid base64 image data")
+        raise
+
     if not settings.verify_api_key(payload.api_key):
         raise HTTPException(status_code=401, detail="Invalid API key")
 
@@ -61,11 +154,8 @@ async def upload_screenshot(payload: ScreenshotUploadRequest):
                 status_code=400, detail=f"Unknown symbol: {payload.symbol}"
             )
 
-    # Decode base64 image
-    try:
-        image_data = base64.b64decode(payload.image_base64)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid base64 image data")
+    # Already base64-decoded by ScreenshotUploadRequest
+    image_data = payload.image_base64
 
     # Validate image size (max 5MB)
     max_size = settings.max_screenshot_size_mb * 1024 * 1024
@@ -75,46 +165,41 @@ async def upload_screenshot(payload: ScreenshotUploadRequest):
             detail=f"Image too large: {len(image_data)} bytes (max {max_size})",
         )
 
-    # Compress with Pillow if needed
-    try:
-        from io import BytesIO
-
-        from PIL import Image
-
-        img = Image.open(BytesIO(image_data))
-
-        # Convert to RGB if needed (PNG may have alpha)
-        if img.mode in ("RGBA", "P"):
-            img = img.convert("RGB")
-
-        # Save as JPEG with configured quality
-        output = BytesIO()
-        img.save(output, format="JPEG", quality=settings.screenshot_quality)
-        image_data = output.getvalue()
-    except ImportError:
-        # Pillow not installed — store as-is
+    # Compress with Pillow if available
+    if Image is None:
         logger.warning("Pillow not installed, storing screenshot without compression")
-    except Exception as e:
-        logger.warning("Image compression failed, storing as-is: %s", e)
-
-    # Create directory and save file
+    else:
+        try:
+            img = Image.open(BytesIO(image_data))
+
+            # Convert to RGB if needed (PNG may have alpha)
+            if img.mode in ("RGBA", "P"):
+                img = img.convert("RGB")
+
+            # Save as JPEG with configured quality
+            output = BytesIO()
+            img.save(output, format="JPEG", quality=settings.screenshot_quality)
+            image_data = output.getvalue()
+        except Exception as e:
+            logger.warning("Image compression failed, storing as-is: %s", e)
+
+    # Save (deduplicated) file
     file_path = _screenshot_path(payload.week_start, payload.symbol, payload.timeframe)
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-    with open(file_path, "wb") as f:
-        f.write(image_data)
+    content_sha256 = await _store_content_addressed(image_data, file_path)
 
     # Store metadata in database
     async with pool.acquire() as conn:
         await conn.execute(
             """
             INSERT INTO chart_screenshots
-                (symbol, timeframe, week_start, file_path, file_size_bytes, uploaded_at)
-            VALUES ($1, $2, $3, $4, $5, NOW())
+                (symbol, timeframe, week_start, file_path, file_size_bytes,
+                 content_sha256, uploaded_at)
+            VALUES ($1, $2, $3, $4, $5, $6, NOW())
             ON CONFLICT (symbol, timeframe, week_start)
             DO UPDATE SET
                 file_path = EXCLUDED.file_path,
                 file_size_bytes = EXCLUDED.file_size_bytes,
+                content_sha256 = EXCLUDED.content_sha256,
                 uploaded_at = NOW()
             """,
             payload.symbol,
@@ -122,6 +207,7 @@ async def upload_screenshot(payload: ScreenshotUploadRequest):
             payload.week_start,
             file_path,
             len(image_data),
+            content_sha256,
         )
 
         # Check if all 4 timeframes are now uploaded
@@ -144,6 +230,7 @@ async def upload_screenshot(payload: ScreenshotUploadRequest):
             "timeframe": payload.timeframe,
             "week_start": str(payload.week_start),
             "file_size": len(image_data),
+            "content_sha256": content_sha256,
             "ready_for_analysis": ready,
         },
     )
@@ -205,15 +292,7 @@ async def get_screenshots(
             ws,
         )
 
-    screenshots = [
-        ScreenshotInfo(
-            timeframe=r["timeframe"],
-            file_path=r["file_path"],
-            file_size_bytes=r["file_size_bytes"],
-            uploaded_at=r["uploaded_at"],
-        )
-        for r in rows
-    ]
+    screenshots = [ScreenshotInfo.model_construct(**dict(r)) for r in rows]
 
     uploaded_tfs = {s.timeframe for s in screenshots}
     complete = uploaded_tfs >= REQUIRED_TIMEFRAMES
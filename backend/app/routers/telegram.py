@@ -0,0 +1,40 @@
+import hmac
+import logging
+
+import orjson
+from fastapi import APIRouter, Header, HTTPException, Request
+
+from app.config import settings
+
+router = APIRouter(tags=["telegram"])
+logger = logging.getLogger(__name__)
+
+
+@router.post("/telegram/webhook", include_in_schema=False)
+async def telegram_webhook(
+    request: Request,
+    secret: str | None = Header(default=None, alias="X-Telegram-Bot-Api-Secret-Token"),
+):
+    """Receive bot updates pushed by Telegram (webhook mode only)."""
+    from app.telegram_bot import get_bot
+
+    # No secret configured means webhook mode is off (the bot polls instead)
+    if not settings.telegram_webhook_secret or not hmac.compare_digest(
+        secret or "", settings.telegram_webhook_secret
+    ):
+        raise HTTPException(status_code=403, detail="Invalid secret token")
+
+    bot = get_bot()
+    if bot is None or not bot._running:
+        raise HTTPException(status_code=503, detail="Telegram bot not running")
+
+    # Queue for the bot's dispatcher and ack right away; Telegram retries
+    # deliveries that take too long to answer
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Update must be a JSON object")
+    await bot.enqueue_update(data)
+    return {"ok": True}
@@ -2,79 +2,156 @@ import asyncio
 import logging
 from datetime import date, timedelta
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database import get_pool
+from app.engines.post_trade_review import REVIEW_Q
+from app.request_body import json_body_openapi, parse_json_body
 from app.schemas.trades import (
     TradeResponse,
     TradeUploadBatch,
     TradeUploadResponse,
 )
 
-router = APIRouter(tags=["trades"])
+router = APIRouter(tags=["trades"], default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 
-@router.post("/trades", response_model=TradeUploadResponse)
-async def upload_trades(payload: TradeUploadBatch):
+# Batches at or above this size are bulk-loaded with COPY into a staging
+# table; smaller ones are upserted from unnest()ed column arrays.
+_COPY_THRESHOLD = 200
+
+_TRADE_COLUMNS = (
+    "symbol", "open_time", "close_time", "open_price", "close_price",
+    "sl_price", "tp_price", "lot_size", "pnl_amount", "pnl_percent",
+    "result", "week_start", "magic_number",
+)
+
+# Postgres array type per _TRADE_COLUMNS entry, for the unnest path
+_TRADE_ARRAY_TYPES = (
+    "text", "timestamp", "timestamp", "float8", "float8",
+    "float8", "float8", "float8", "float8", "float8",
+    "text", "date", "int8",
+)
+
+_UPSERT_SET = """
+    close_time = EXCLUDED.close_time,
+    close_price = EXCLUDED.close_price,
+    pnl_amount = EXCLUDED.pnl_amount,
+    pnl_percent = EXCLUDED.pnl_percent,
+    result = EXCLUDED.result
+"""
+
+
+def _trade_records(trades) -> list[tuple]:
+    """Build DB tuples (in _TRADE_COLUMNS order) for uploaded trades."""
+    records = []
+    for t in trades:
+        # Calculate week_start (Monday) from open_time
+        open_date = t.open_time.date()
+        week_start = open_date - timedelta(days=open_date.weekday())
+        records.append((
+            t.symbol, t.open_time, t.close_time, t.open_price, t.close_price,
+            t.sl_price, t.tp_price, t.lot_size, t.pnl_amount, t.pnl_percent,
+            t.result, week_start, t.magic_number,
+        ))
+    return records
+
+
+def _upsert_from(source: str) -> str:
+    """INSERT ... SELECT upsert of staged rows (with a seq column) into trades.
+
+    Keeps one row per conflict key, the last occurrence winning as with
+    sequential upserts. Rows with a NULL magic_number never conflict under
+    the UNIQUE constraint, so each keeps its own key (its seq) and is
+    inserted. Returns (id, inserted) records.
+    """
+    cols = ", ".join(_TRADE_COLUMNS)
+    return f"""
+        INSERT INTO trades ({cols})
+        SELECT DISTINCT ON (symbol, open_time, magic_number,
+                            CASE WHEN magic_number IS NULL THEN seq END) {cols}
+        FROM {source}
+        ORDER BY symbol, open_time, magic_number,
+                 CASE WHEN magic_number IS NULL THEN seq END, seq DESC
+        ON CONFLICT (symbol, open_time, magic_number) DO UPDATE SET
+        {_UPSERT_SET}
+        RETURNING id, (xmax = 0) AS inserted
+    """
+
+
+_UNNEST_UPSERT = _upsert_from(
+    "unnest({}) WITH ORDINALITY AS s({}, seq)".format(
+        ", ".join(
+            f"${i + 1}::{t}[]" for i, t in enumerate(_TRADE_ARRAY_TYPES)
+        ),
+        ", ".join(_TRADE_COLUMNS),
+    )
+)
+_COPY_UPSERT = _upsert_from("_stage_trades")
+
+
+async def _unnest_upsert(conn, records: list[tuple]) -> list:
+    """Upsert a small batch in one statement from per-column arrays."""
+    if not records:
+        return []
+    return await conn.fetch(_UNNEST_UPSERT, *map(list, zip(*records)))
+
+
+async def _copy_upsert(conn, records: list[tuple]) -> list:
+    """COPY into a staging table, then one INSERT ... SELECT upsert."""
+    cols = ", ".join(_TRADE_COLUMNS)
+    async with conn.transaction():
+        await conn.execute(
+            f"""
+            CREATE TEMP TABLE _stage_trades ON COMMIT DROP AS
+            SELECT 0 AS seq, {cols} FROM trades WITH NO DATA
+            """
+        )
+        await conn.copy_records_to_table(
+            "_stage_trades",
+            records=[(i, *rec) for i, rec in enumerate(records)],
+            columns=("seq", *_TRADE_COLUMNS),
+        )
+        return await conn.fetch(_COPY_UPSERT)
+
+
+@router.post(
+    "/trades",
+    response_model=TradeUploadResponse,
+    openapi_extra=json_body_openapi(TradeUploadBatch),
+)
+async def upload_trades(request: Request):
     """Upload individual trade records from the EA. Auth via apiKey in body."""
+    payload = await parse_json_body(request, TradeUploadBatch)
+
     if not settings.verify_api_key(payload.api_key):
         raise HTTPException(status_code=401, detail="Invalid API key")
 
     pool = await get_pool()
-    inserted = 0
+    records = _trade_records(payload.trades)
 
     async with pool.acquire() as conn:
-        for t in payload.trades:
-            # Calculate week_start (Monday) from open_time
-            open_date = t.open_time.date()
-            week_start = open_date - timedelta(days=open_date.weekday())
+        if len(records) >= _COPY_THRESHOLD:
+            rows = await _copy_upsert(conn, records)
+        else:
+            rows = await _unnest_upsert(conn, records)
 
-            status = await conn.execute(
-                """
-                INSERT INTO trades
-                    (symbol, open_time, close_time, open_price, close_price,
-                     sl_price, tp_price, lot_size, pnl_amount, pnl_percent,
-                     result, week_start, magic_number)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
-                ON CONFLICT (symbol, open_time, magic_number) DO UPDATE SET
-                    close_time = EXCLUDED.close_time,
-                    close_price = EXCLUDED.close_price,
-                    pnl_amount = EXCLUDED.pnl_amount,
-                    pnl_percent = EXCLUDED.pnl_percent,
-                    result = EXCLUDED.result
-                """,
-                t.symbol,
-                t.open_time,
-                t.close_time,
-                t.open_price,
-                t.close_price,
-                t.sl_price,
-                t.tp_price,
-                t.lot_size,
-                t.pnl_amount,
-                t.pnl_percent,
-                t.result,
-                week_start,
-                t.magic_number,
+    # Hand newly inserted trades to the review worker as one batch.
+    # Reviews are best-effort: never hold up the EA's upload for them.
+    new_ids: list[int] = [r["id"] for r in rows if r["inserted"]]
+    if new_ids:
+        try:
+            REVIEW_Q.put_nowait(new_ids)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Review queue full — skipping post-trade review for %d trades",
+                len(new_ids),
             )
-            if "INSERT" in status:
-                inserted += 1
-                # Fetch the trade ID and trigger post-trade review asynchronously
-                trade_id = await conn.fetchval(
-                    """
-                    SELECT id FROM trades
-                    WHERE symbol = $1 AND open_time = $2 AND magic_number = $3
-                    """,
-                    t.symbol,
-                    t.open_time,
-                    t.magic_number,
-                )
-                if trade_id:
-                    from app.engines.post_trade_review import review_closed_trade
-                    asyncio.create_task(review_closed_trade(trade_id))
 
+    inserted = len(new_ids)
     duplicates = len(payload.trades) - inserted
     logger.info(
         "trade_upload: received=%d inserted=%d duplicates=%d",
@@ -139,21 +216,6 @@ async def get_trades(
                 symbol,
             )
 
-    return [
-        TradeResponse(
-            id=r["id"],
-            symbol=r["symbol"],
-            open_time=r["open_time"],
-            close_time=r["close_time"],
-            open_price=r["open_price"],
-            close_price=r["close_price"],
-            sl_price=r["sl_price"],
-            tp_price=r["tp_price"],
-            lot_size=r["lot_size"],
-            pnl_amount=r["pnl_amount"],
-            pnl_percent=r["pnl_percent"],
-            result=r["result"],
-            week_start=r["week_start"],
-        )
-        for r in rows
-    ]
+    # Rows match TradeResponse field-for-field; orjson handles the
+    # datetime/date columns natively, so skip per-row model validation.
+    return ORJSONResponse([dict(r) for r in rows])
@@ -1,51 +1,41 @@
 from datetime import date
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_serializer
 
+# Indicator / percentage outputs; 4 decimals is well beyond their precision.
+# current_price is left exact (FX quotes carry 5 decimals).
+_ROUNDED_FIELDS = (
+    "technical_score", "avg_daily_growth", "avg_daily_loss",
+    "most_bullish_day", "most_bearish_day", "up_day_win_rate",
+    "sma_20", "sma_50", "sma_200", "rsi_14", "atr_14", "daily_range_pct",
+    "change_1w", "change_2w", "change_1m", "change_3m",
+    "backtest_score", "fundamental_score", "final_score",
+    "opt_sl_percent", "opt_tp_percent",
+    "bt_total_return", "bt_win_rate", "bt_profit_factor",
+    "bt_max_drawdown", "bt_param_stability",
+)
 
-class SymbolAnalytics(BaseModel):
+
+def _round4(v: float) -> float:
+    return round(v, 4)
+
+
+class _AnalyticsBase(BaseModel):
+    """Fields stored in weekly_analysis, shared by both analytics responses."""
+
+    # Read-only response snapshots; never mutated after construction
+    model_config = ConfigDict(frozen=True, ser_json_inf_nan="null")
+
+    # Identity
     symbol: str
     week_start: date
-    technical_score: float | None = None
-    avg_daily_growth: float | None = None
-    avg_daily_loss: float | None = None
-    most_bullish_day: float | None = None
-    most_bearish_day: float | None = None
-    up_day_win_rate: float | None = None
-    current_price: float | None = None
-    sma_20: float | None = None
-    sma_50: float | None = None
-    sma_200: float | None = None
-    rsi_14: float | None = None
-    atr_14: float | None = None
-    daily_range_pct: float | None = None
-    change_1w: float | None = None
-    change_2w: float | None = None
-    change_1m: float | None = None
-    change_3m: float | None = None
-    candle_count: int = 0
-    daily_bar_count: int = 0
-    # Backtest fields
-    backtest_score: float | None = None
-    fundamental_score: float | None = None
-    final_score: float | None = None
-    rank: int | None = None
+    # Flags and counts
     is_active: bool = False
     is_manually_overridden: bool = False
+    rank: int | None = None
     opt_entry_hour: int | None = None
-    opt_sl_percent: float | None = None
-    opt_tp_percent: float | None = None
-    bt_total_return: float | None = None
-    bt_win_rate: float | None = None
-    bt_profit_factor: float | None = None
     bt_total_trades: int | None = None
-    bt_max_drawdown: float | None = None
-    bt_param_stability: float | None = None
-
-
-class AnalysisSummary(BaseModel):
-    symbol: str
-    week_start: date
+    # Daily statistics
     technical_score: float | None = None
     avg_daily_growth: float | None = None
     avg_daily_loss: float | None = None
@@ -56,22 +46,49 @@ class AnalysisSummary(BaseModel):
     backtest_score: float | None = None
     fundamental_score: float | None = None
     final_score: float | None = None
-    rank: int | None = None
-    is_active: bool = False
-    is_manually_overridden: bool = False
-    opt_entry_hour: int | None = None
     opt_sl_percent: float | None = None
     opt_tp_percent: float | None = None
     bt_total_return: float | None = None
     bt_win_rate: float | None = None
     bt_profit_factor: float | None = None
-    bt_total_trades: int | None = None
     bt_max_drawdown: float | None = None
     bt_param_stability: float | None = None
 
+    _round_floats = field_serializer(
+        *_ROUNDED_FIELDS, when_used="json-unless-none", check_fields=False
+    )(_round4)
+
+
+class SymbolAnalytics(_AnalyticsBase):
+    """Stored analysis plus live technical metrics for one symbol."""
+
+    candle_count: int = 0
+    daily_bar_count: int = 0
+    current_price: float | None = None
+    sma_20: float | None = None
+    sma_50: float | None = None
+    sma_200: float | None = None
+    rsi_14: float | None = None
+    atr_14: float | None = None
+    daily_range_pct: float | None = None
+    change_1w: float | None = None
+    change_2w: float | None = None
+    change_1m: float | None = None
+    change_3m: float | None = None
+
+
+class AnalysisSummary(_AnalyticsBase):
+    """Dashboard overview row (stored fields only)."""
+
+
+class AnalysisError(BaseModel):
+    symbol: str
+    error: str
+
 
 class RunAnalysisResponse(BaseModel):
     week_start: date
     analyzed: int
     failed: int
-    results: list[dict]
+    results: list[AnalysisSummary]
+    errors: list[AnalysisError] = []
@@ -1,7 +1,23 @@
+import re
 from datetime import datetime
 
+import numpy as np
 from pydantic import BaseModel, Field, field_validator
 
+# MQL5 TimeToString format: '2024.02.14 12:00:00' (seconds optional)
+_MQL5_RE = re.compile(r"(\d{4})\.(\d{2})\.(\d{2}) (\d{2}):(\d{2})(?::(\d{2}))?")
+
+
+# Column layout of CandleData.batch_to_numpy (float64 keeps index prices exact)
+CANDLE_DTYPE = np.dtype([
+    ("time", "datetime64[s]"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
 
 class CandleData(BaseModel):
     time: datetime
@@ -15,10 +31,27 @@ class CandleData(BaseModel):
     @classmethod
     def parse_mql5_time(cls, v):
         """Accept MQL5 format '2024.02.14 12:00:00' alongside ISO 8601."""
-        if isinstance(v, str) and "." in v[:10]:
-            v = v.replace(".", "-", 2)
+        if isinstance(v, str):
+            m = _MQL5_RE.fullmatch(v)
+            if m:
+                y, mo, d, h, mi, sec = m.groups()
+                return datetime(int(y), int(mo), int(d), int(h), int(mi), int(sec or 0))
+            if "." in v[:10]:
+                v = v.replace(".", "-", 2)
         return v
 
+    @classmethod
+    def batch_to_numpy(cls, items: list["CandleData"]) -> np.ndarray:
+        """Pack candles into a CANDLE_DTYPE structured array, column by column."""
+        arr = np.empty(len(items), dtype=CANDLE_DTYPE)
+        arr["time"] = [c.time for c in items]
+        arr["open"] = [c.open for c in items]
+        arr["high"] = [c.high for c in items]
+        arr["low"] = [c.low for c in items]
+        arr["close"] = [c.close for c in items]
+        arr["volume"] = [c.volume for c in items]
+        return arr
+
 
 class CandleUploadRequest(BaseModel):
     symbol: str = Field(..., max_length=20)
@@ -21,13 +21,14 @@ class WeeklyScoreRecord(BaseModel):
     bt_max_drawdown: Optional[float] = None
 
 
-class HeatmapCell(BaseModel):
-    sl_pct: float
-    tp_pct: float
-    total_return: float
-    win_rate: float
-    profit_factor: float
-    total_trades: int
+class HeatmapMatrix(BaseModel):
+    """SL x TP backtest grid as parallel arrays: metric[i][j] is sl_pcts[i], tp_pcts[j]."""
+    sl_pcts: list[float]
+    tp_pcts: list[float]
+    total_return: list[list[float]]
+    win_rate: list[list[float]]
+    profit_factor: list[list[float]]
+    total_trades: list[list[int]]
 
 
 class HourReturn(BaseModel):
@@ -39,7 +40,7 @@ class HourReturn(BaseModel):
 class HeatmapResponse(BaseModel):
     symbol: str
     entry_hour: int
-    grid: list[HeatmapCell]
+    grid: HeatmapMatrix
     entry_hour_returns: list[HourReturn]
 
 
@@ -11,19 +11,23 @@ class MarketInfo(BaseModel):
     latest_time: datetime | None = None
 
 
-class MarketConfigResponse(BaseModel):
+class MarketConfigCore(BaseModel):
+    """Weekly trading parameters for a symbol (dashboard override response)."""
     symbol: str
+    week_start: str = Field(serialization_alias="weekStart")
     active: bool
     entry_hour: int = Field(serialization_alias="entryHour")
     entry_minute: int = Field(serialization_alias="entryMinute")
     sl_percent: float = Field(serialization_alias="slPercent")
     tp_percent: float = Field(serialization_alias="tpPercent")
-    week_start: str = Field(serialization_alias="weekStart")
-    # Smart position management fields
-    tp1_close_pct: float = Field(default=0.5, serialization_alias="tp1ClosePct")  # % of position to close at TP1
-    tp2_percent: float = Field(default=0.0, serialization_alias="tp2Percent")  # Extended TP target (0 = disabled)
+
+
+class MarketConfigResponse(MarketConfigCore):
+    """Full EA config: core parameters plus smart position management."""
     ai_confidence: str = Field(default="none", serialization_alias="aiConfidence")  # high/medium/low/none
     use_trailing_stop: bool = Field(default=False, serialization_alias="useTrailingStop")
+    tp1_close_pct: float = Field(default=0.5, serialization_alias="tp1ClosePct")  # % of position to close at TP1
+    tp2_percent: float = Field(default=0.0, serialization_alias="tp2Percent")  # Extended TP target (0 = disabled)
     trailing_stop_distance: float = Field(default=0.0, serialization_alias="trailingStopDistance")  # % distance
 
 
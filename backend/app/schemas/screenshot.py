@@ -1,6 +1,11 @@
 from datetime import date, datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+try:
+    from pybase64 import b64decode  # SIMD decoder
+except ImportError:
+    from base64 import b64decode
 
 
 class ScreenshotUploadRequest(BaseModel):
@@ -10,7 +15,22 @@ class ScreenshotUploadRequest(BaseModel):
     timeframe: str = Field(..., pattern=r"^(D1|H4|H1|M5)$")
     week_start: date
     api_key: str = Field(..., alias="apiKey")
-    image_base64: str = Field(..., description="Base64-encoded JPEG image data")
+    image_base64: bytes = Field(..., description="Base64-encoded JPEG image data")
+
+    @field_validator("image_base64", mode="before")
+    @classmethod
+    def decode_image(cls, v):
+        """Decode once during validation; the field holds raw image bytes.
+
+        Strict: characters outside the base64 alphabet are rejected rather
+        than silently dropped, so a corrupted upload is never stored.
+        """
+        if isinstance(v, (str, bytes)):
+            try:
+                return b64decode(v, validate=True)
+            except ValueError:
+                raise ValueError("Invalid base64 image data")
+        return v
 
 
 class ScreenshotUploadResponse(BaseModel):
@@ -13,16 +13,18 @@ Cost: ~$0.05-0.10 per run (web search + tokens).
 import asyncio
 import json
 import logging
-import re
 import sys
 import os
 
+import orjson
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.anthropic_client import get_client
 from app.config import settings
 from app.database import get_pool, close_pool
 from app.logging_config import setup_logging
-from app.telegram import send_message
+from app.telegram import close_session, send_message
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -47,6 +49,9 @@ INDICES_AND_COMMODITIES = {
 
 # All markets for store/validation
 MARKETS = {**INDICES_AND_COMMODITIES}
+MARKET_SYMBOLS = frozenset(MARKETS)
+
+_LENIENT_JSON = json.JSONDecoder(strict=False)
 
 PROMPT = """You are a professional macro-economic analyst helping a trader decide which stock indices and commodities are likely to move up next week.
 
@@ -90,36 +95,33 @@ Respond with ONLY valid JSON (no markdown fences, no explanation outside the JSO
 
 def extract_json(text: str) -> dict:
     """Find and parse the JSON object from Claude's response text."""
-    # Strip markdown code fences if present
-    text = re.sub(r"```(?:json)?\s*", "", text)
-    text = re.sub(r"\s*```", "", text)
-
-    # Find the outermost JSON object { ... }
+    # Markdown fences or prose around the object are skipped by slicing
+    # from the first "{"
     start = text.find("{")
     if start == -1:
         return {}
 
-    depth = 0
-    for i in range(start, len(text)):
-        if text[i] == "{":
-            depth += 1
-        elif text[i] == "}":
-            depth -= 1
-            if depth == 0:
-                return json.loads(text[start : i + 1], strict=False)
-    return {}
+    # Usual case: the block is just the object (possibly fenced)
+    end = text.rfind("}")
+    try:
+        result = orjson.loads(text[start : end + 1])
+    except orjson.JSONDecodeError:
+        # Trailing prose containing "}" or raw control characters in strings:
+        # take the first complete object, leniently
+        try:
+            result, _ = _LENIENT_JSON.raw_decode(text, start)
+        except ValueError:
+            return {}
+    return result if isinstance(result, dict) else {}
 
 
 def call_claude() -> dict:
     """Ask Claude to research all markets using web search and return predictions."""
-    import anthropic
-
-    api_key = settings.anthropic_api_key
-    if not api_key:
+    if not settings.anthropic_api_key:
         logger.error("LE_ANTHROPIC_API_KEY not set — cannot run auto outlook")
         return {}
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = get_client()
 
     response = client.messages.create(
         model="claude-sonnet-4-5-20250929",
@@ -167,42 +169,45 @@ def call_claude() -> dict:
 
 async def store_predictions(predictions: dict) -> None:
     """Write per-market AI predictions to the database."""
+    rows = []
+    for symbol, data in predictions.items():
+        if symbol not in MARKET_SYMBOLS:
+            continue
+        pred = data.get("prediction", "neutral")
+        score = float(data.get("score", 50))
+        reasoning = data.get("reasoning", "")
+
+        # Clamp score to 0-100
+        score = max(0.0, min(100.0, score))
+
+        rows.append((symbol, pred, score, reasoning))
+        logger.info(
+            "  %s %-7s: %s (score=%.0f) — %s",
+            symbol,
+            f"({MARKETS[symbol]})",
+            pred.upper(),
+            score,
+            reasoning[:80],
+        )
+
+    if not rows:
+        return
+
     pool = await get_pool()
     async with pool.acquire() as conn:
-        for symbol, data in predictions.items():
-            if symbol not in MARKETS:
-                continue
-            pred = data.get("prediction", "neutral")
-            score = float(data.get("score", 50))
-            reasoning = data.get("reasoning", "")
-
-            # Clamp score to 0-100
-            score = max(0.0, min(100.0, score))
-
-            await conn.execute(
-                """
-                INSERT INTO market_ai_prediction (symbol, prediction, score, reasoning, updated_at)
-                VALUES ($1, $2, $3, $4, NOW())
-                ON CONFLICT (symbol)
-                DO UPDATE SET
-                    prediction = EXCLUDED.prediction,
-                    score = EXCLUDED.score,
-                    reasoning = EXCLUDED.reasoning,
-                    updated_at = NOW()
-                """,
-                symbol,
-                pred,
-                score,
-                reasoning,
-            )
-            logger.info(
-                "  %s %-7s: %s (score=%.0f) — %s",
-                symbol,
-                f"({MARKETS[symbol]})",
-                pred.upper(),
-                score,
-                reasoning[:80],
-            )
+        await conn.executemany(
+            """
+            INSERT INTO market_ai_prediction (symbol, prediction, score, reasoning, updated_at)
+            VALUES ($1, $2, $3, $4, NOW())
+            ON CONFLICT (symbol)
+            DO UPDATE SET
+                prediction = EXCLUDED.prediction,
+                score = EXCLUDED.score,
+                reasoning = EXCLUDED.reasoning,
+                updated_at = NOW()
+            """,
+            rows,
+        )
 
 
 async def main():
@@ -230,15 +235,23 @@ async def main():
         await close_pool()
 
     # Send Telegram summary
-    bullish = [s for s, d in predictions.items() if s in MARKETS and d.get("prediction") == "bullish"]
-    bearish = [s for s, d in predictions.items() if s in MARKETS and d.get("prediction") == "bearish"]
+    bullish, bearish = [], []
+    for symbol, data in predictions.items():
+        if symbol not in MARKET_SYMBOLS:
+            continue
+        pred = data.get("prediction")
+        if pred == "bullish":
+            bullish.append(symbol)
+        elif pred == "bearish":
+            bearish.append(symbol)
     lines = ["<b>AI Outlook Updated</b>"]
     if bullish:
         lines.append(f"Bullish: {', '.join(bullish)}")
     if bearish:
         lines.append(f"Bearish: {', '.join(bearish)}")
     lines.append(f"\n{len(predictions)} markets analyzed via web search.")
-    send_message("\n".join(lines))
+    await send_message("\n".join(lines))
+    await close_session()
 
     logger.info("=== Auto Outlook Complete ===")
 
@@ -11,17 +11,38 @@ Usage:
 import asyncio
 import logging
 import sys
+from html import escape
+from collections.abc import Iterator
 
 from app.database import close_pool, get_pool
 from app.engines.analytics import run_full_analysis
 from app.logging_config import setup_logging
-from app.telegram import send_message
+from app.telegram import close_session, send_message
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
+_BIAS_EMOJI = {"bullish": "↑", "bearish": "↓", "neutral": "→"}
 
-async def main():
+
+def _chunks(lines: list[str], limit: int = 4000) -> Iterator[str]:
+    """Join lines into messages under Telegram's 4096-char sendMessage cap.
+
+    Splits only on line boundaries so HTML tags are never cut in half.
+    """
+    buf: list[str] = []
+    n = 0
+    for line in lines:
+        if buf and n + len(line) + 1 > limit:
+            yield "\n".join(buf)
+            buf, n = [], 0
+        buf.append(line)
+        n += len(line) + 1
+    if buf:
+        yield "\n".join(buf)
+
+
+async def main() -> int:
     logger.info("=== Weekly Analysis Script Started ===")
 
     try:
@@ -31,29 +52,30 @@ async def main():
         # Run analysis for all symbols
         results = await run_full_analysis()
 
-        analyzed = sum(1 for r in results if "error" not in r)
-        failed = sum(1 for r in results if "error" in r)
-
-        logger.info("=== Analysis Complete: %d analyzed, %d failed ===", analyzed, failed)
-
-        # Print summary to stdout for cron log
-        print(f"\nWeekly Analysis Summary:")
-        print(f"  Analyzed: {analyzed}")
-        print(f"  Failed:   {failed}")
-        print()
-
-        active = [r for r in results if r.get("is_active")]
-        active.sort(key=lambda r: r.get("rank", 99))
-
+        # Classify results in a single pass
+        analyzed = failed = ai_count = 0
+        active: list[dict] = []
+        failed_symbols: list[str] = []
         for r in results:
             if "error" in r:
-                print(f"  {r['symbol']}: ERROR - {r['error']}")
+                failed += 1
+                failed_symbols.append(escape(r["symbol"]))
+                logger.info("%s: ERROR - %s", r["symbol"], r["error"])
+                continue
+            analyzed += 1
+            if r.get("ai_score") is not None:
+                ai_count += 1
+            if r.get("is_active"):
+                active.append(r)
+                status = " [ACTIVE]"
             else:
-                status = " [ACTIVE]" if r.get("is_active") else ""
-                print(f"  {r['symbol']}: final={r.get('final_score', 0):.1f}{status}")
+                status = ""
+            logger.info("%s: final=%.1f%s", r["symbol"], r.get("final_score", 0), status)
+        active.sort(key=lambda r: r.get("rank", 99))
+
+        logger.info("=== Analysis Complete: %d analyzed, %d failed ===", analyzed, failed)
 
         # Send Telegram notification
-        ai_count = sum(1 for r in results if r.get("ai_score") is not None)
         lines = [f"<b>Weekly Analysis Complete</b>"]
         lines.append(f"{analyzed} markets analyzed, {failed} failed")
         if ai_count > 0:
@@ -62,13 +84,15 @@ async def main():
         if active:
             lines.append("<b>Active markets this week:</b>")
             for r in active:
+                # Symbols go into HTML-parsed text; one bad char rejects the message
+                symbol = escape(r["symbol"])
                 # Show AI score if available, otherwise technical
                 if r.get("ai_score") is not None:
-                    confidence = r.get("ai_confidence", "?").upper()
+                    confidence = escape(r.get("ai_confidence", "?").upper())
                     bias = r.get("ai_bias", "?")
-                    bias_emoji = {"bullish": "↑", "bearish": "↓", "neutral": "→"}.get(bias, "?")
+                    bias_emoji = _BIAS_EMOJI.get(bias, "?")
                     lines.append(
-                        f"  #{r.get('rank', '?')} <b>{r['symbol']}</b> — "
+                        f"  #{r.get('rank', '?')} <b>{symbol}</b> — "
                         f"score {r.get('final_score', 0):.0f} "
                         f"[{confidence} {bias_emoji}] "
                         f"(AI:{r['ai_score']:.0f} "
@@ -77,7 +101,7 @@ async def main():
                     )
                 else:
                     lines.append(
-                        f"  #{r.get('rank', '?')} <b>{r['symbol']}</b> — "
+                        f"  #{r.get('rank', '?')} <b>{symbol}</b> — "
                         f"score {r.get('final_score', 0):.0f} "
                         f"(T:{r.get('technical_score', 0):.0f} "
                         f"B:{r.get('backtest_score', 0):.0f} "
@@ -86,23 +110,32 @@ async def main():
         else:
             lines.append("No markets activated (all below threshold).")
         if failed > 0:
-            failed_symbols = [r["symbol"] for r in results if "error" in r]
             lines.append(f"\nFailed: {', '.join(failed_symbols)}")
-        send_message("\n".join(lines))
+        # A notification failure must not take down the run or skip pool teardown
+        try:
+            for chunk in _chunks(lines):
+                await send_message(chunk)
+        except Exception:
+            logger.exception("Failed to send weekly summary")
 
         # Only fail if majority of symbols failed (not on individual failures)
         total = analyzed + failed
         if total > 0 and failed > total / 2:
             logger.error("Majority of symbols failed (%d/%d), exiting with error", failed, total)
-            sys.exit(1)
+            return 1
+        return 0
 
     except Exception:
         logger.exception("Weekly analysis script failed")
-        send_message("Weekly analysis script FAILED — check logs.")
-        sys.exit(2)
+        try:
+            await send_message("Weekly analysis script FAILED — check logs.")
+        except Exception:
+            logger.exception("Failed to send failure notification")
+        return 2
     finally:
+        await close_session()
         await close_pool()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(asyncio.run(main()))
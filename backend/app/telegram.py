@@ -12,41 +12,187 @@ Setup:
   4. Set env vars: LE_TELEGRAM_BOT_TOKEN, LE_TELEGRAM_CHAT_ID
 """
 
+import asyncio
 import logging
-from urllib.request import Request, urlopen
-from urllib.error import URLError
-import json
+
+import httpx
+import orjson
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Settings don't change at runtime, so resolve the endpoint once at import
+_CHAT_ID = settings.telegram_chat_id
+_URL = (
+    f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendMessage"
+    if settings.telegram_bot_token and _CHAT_ID
+    else ""
+)
+_ENABLED = bool(_URL)
+
+# Static part of the sendMessage body; only the text is encoded per call
+_PAYLOAD_PREFIX = orjson.dumps({
+    "chat_id": _CHAT_ID,
+    "parse_mode": "HTML",
+    "disable_web_page_preview": True,
+})[:-1] + b',"text":'
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One keep-alive client per process so repeated notifications reuse the
+# TCP+TLS connection to api.telegram.org instead of handshaking every time.
+_session: httpx.AsyncClient | None = None
+
+# 429 (flood control) and 5xx are retried; anything else fails immediately
+_MAX_ATTEMPTS = 3
+_MAX_RETRY_DELAY = 60
+
+# Request aggregation: messages queued while a sendMessage is in flight go
+# out together in the next one. Each entry carries the caller's future,
+# resolved with the delivery result.
+_MAX_BATCH = 10
+_MAX_BATCH_CHARS = 4000
+_FLUSH_TIMEOUT = 15
+_queue: asyncio.Queue[tuple[str, asyncio.Future]] | None = None
+_flusher_task: asyncio.Task | None = None
+
+
+def _get_session() -> httpx.AsyncClient:
+    global _session
+    if _session is None:
+        _session = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=4, keepalive_expiry=75),
+        )
+    return _session
+
+
+async def flush() -> None:
+    """Wait (up to _FLUSH_TIMEOUT) until every queued message has been posted."""
+    if _queue is not None:
+        await asyncio.wait_for(_queue.join(), timeout=_FLUSH_TIMEOUT)
+
+
+async def close_session() -> None:
+    global _session, _queue, _flusher_task
+    try:
+        await flush()
+    except TimeoutError:
+        logger.warning("Telegram queue not drained after %ss — dropping it", _FLUSH_TIMEOUT)
+    if _flusher_task is not None:
+        # Cancelling resolves any still-pending messages as not delivered
+        task, _flusher_task, _queue = _flusher_task, None, None
+        task.cancel()
+        if task.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([task])
+    if _session is not None:
+        await _session.aclose()
+        _session = None
 
-def send_message(text: str) -> bool:
-    """Send a Telegram message. Returns True on success, False on failure."""
-    token = settings.telegram_bot_token
-    chat_id = settings.telegram_chat_id
 
-    if not token or not chat_id:
+def _get_queue() -> asyncio.Queue[tuple[str, asyncio.Future]]:
+    """Queue served by a live flusher on the running loop, (re)started as needed."""
+    global _queue, _flusher_task
+    loop = asyncio.get_running_loop()
+    if (
+        _flusher_task is None
+        or _flusher_task.done()
+        or _flusher_task.get_loop() is not loop
+    ):
+        _queue = asyncio.Queue()
+        _flusher_task = loop.create_task(_flusher(_queue))
+    return _queue
+
+
+async def send_message(text: str) -> bool:
+    """Send a Telegram message. Returns True once Telegram has accepted it,
+    False if it isn't configured or delivery failed.
+
+    A lone message is posted straight away; messages sent while another
+    sendMessage is in flight are joined into a single follow-up call.
+    """
+    if not _ENABLED:
         logger.debug("Telegram not configured — skipping notification")
         return False
 
-    url = f"https://api.telegram.org/bot{token}/sendMessage"
-    payload = json.dumps({
-        "chat_id": chat_id,
-        "text": text,
-        "parse_mode": "HTML",
-        "disable_web_page_preview": True,
-    }).encode()
+    delivered = asyncio.get_running_loop().create_future()
+    _get_queue().put_nowait((text, delivered))
+    return await delivered
+
+
+def _resolve(item: tuple[str, asyncio.Future], ok: bool) -> None:
+    if not item[1].done():
+        item[1].set_result(ok)
+
 
-    req = Request(url, data=payload, headers={"Content-Type": "application/json"})
+async def _flusher(queue: asyncio.Queue[tuple[str, asyncio.Future]]) -> None:
+    carry: tuple[str, asyncio.Future] | None = None
     try:
-        with urlopen(req, timeout=10) as resp:
-            if resp.status == 200:
-                logger.info("Telegram message sent")
-                return True
-            logger.warning("Telegram API returned %d", resp.status)
+        while True:
+            batch = [carry if carry is not None else await queue.get()]
+            carry = None
+            # One loop tick so senders scheduled alongside this one are batched
+            await asyncio.sleep(0)
+            size = len(batch[0][0])
+            while len(batch) < _MAX_BATCH and not queue.empty():
+                item = queue.get_nowait()
+                if size + len(item[0]) + 2 > _MAX_BATCH_CHARS:
+                    # Would overflow the sendMessage limit — starts the next batch
+                    carry = item
+                    break
+                batch.append(item)
+                size += len(item[0]) + 2
+            ok = False
+            try:
+                ok = await _post("\n\n".join(text for text, _ in batch))
+            except Exception:
+                logger.exception("Failed to send Telegram message")
+            finally:
+                for item in batch:
+                    _resolve(item, ok)
+                    queue.task_done()
+    finally:
+        # Cancelled: nothing queued behind us will be sent
+        if carry is not None:
+            _resolve(carry, False)
+            queue.task_done()
+        while not queue.empty():
+            _resolve(queue.get_nowait(), False)
+            queue.task_done()
+
+
+async def _post(text: str) -> bool:
+    """POST one sendMessage call. Returns True on success, False on failure."""
+    payload = _PAYLOAD_PREFIX + orjson.dumps(text) + b"}"
+
+    session = _get_session()
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            resp = await session.post(_URL, content=payload, headers=_JSON_HEADERS)
+        except httpx.HTTPError:
+            logger.exception("Failed to send Telegram message")
             return False
-    except URLError:
-        logger.exception("Failed to send Telegram message")
+        if resp.status_code == 200:
+            logger.info("Telegram message sent")
+            return True
+
+        last_attempt = attempt == _MAX_ATTEMPTS - 1
+        if resp.status_code == 429 and not last_attempt:
+            # Flood control: Telegram tells us how long to wait
+            try:
+                retry_after = resp.json()["parameters"]["retry_after"]
+            except (ValueError, KeyError, TypeError):
+                retry_after = 1
+            delay = min(retry_after, _MAX_RETRY_DELAY)
+            logger.warning("Telegram rate limited — retrying in %ss", delay)
+            await asyncio.sleep(delay)
+            continue
+        if resp.status_code >= 500 and not last_attempt:
+            delay = 2 ** attempt
+            logger.warning("Telegram API returned %d — retrying in %ds", resp.status_code, delay)
+            await asyncio.sleep(delay)
+            continue
+
+        logger.warning("Telegram API returned %d", resp.status_code)
         return False
+    return False
@@ -15,13 +15,21 @@ Commands:
   /config   — Current settings
   /help     — All commands
 
-Runs in same asyncio loop as FastAPI (polling mode).
+Runs in same asyncio loop as FastAPI. Receives updates via webhook
+(POST /api/telegram/webhook) when LE_TELEGRAM_WEBHOOK_URL is set,
+otherwise by long-polling.
 """
 
 import asyncio
+import functools
+import html
 import logging
+import time
 from datetime import date, datetime, timedelta, timezone
+from typing import Literal
 
+import httpx
+import orjson
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import (
     Application,
@@ -29,12 +37,209 @@ from telegram.ext import (
     CommandHandler,
     ContextTypes,
 )
+from telegram.request import HTTPXRequest
 
 from app.config import settings
 from app.database import get_pool
 
 logger = logging.getLogger(__name__)
 
+# How long cached weekly_analysis reads stay fresh. Analysis runs weekly, so
+# the only churn inside this window is our own overrides, which invalidate.
+_CACHE_TTL = 30.0
+
+OverrideOutcome = Literal["changed", "unchanged", "missing"]
+
+_BIAS_EMOJI = {"bullish": "↑", "bearish": "↓", "neutral": "→"}
+_IMPACT_ICON = {"high": "🔴", "medium": "🟠", "low": "🟡"}
+
+# Recurring statements. Module-level text keeps asyncpg's per-connection
+# statement cache keyed on one string per query, so each is parsed once
+# per pooled connection.
+_SQL_LATEST_WEEK_START = """
+SELECT DISTINCT week_start FROM weekly_analysis
+WHERE final_score IS NOT NULL
+ORDER BY week_start DESC LIMIT 1
+"""
+
+# Top 20 by score for the listing, plus the top 6 active markets (which get
+# deactivate buttons) even if they fall outside the top 20.
+_SQL_MARKET_RANKINGS = """
+WITH latest AS (
+    SELECT DISTINCT ON (wa.symbol) wa.symbol, wa.final_score,
+           wa.technical_score, wa.backtest_score, wa.fundamental_score,
+           wa.ai_score, wa.ai_confidence, wa.ai_bias,
+           wa.is_active, wa.is_manually_overridden, wa.rank,
+           m.category, m.name
+    FROM weekly_analysis wa
+    JOIN markets m ON m.symbol = wa.symbol
+    WHERE wa.final_score IS NOT NULL AND m.is_in_universe = true
+    ORDER BY wa.symbol, wa.week_start DESC
+), ranked AS (
+    SELECT latest.*,
+           ROW_NUMBER() OVER (ORDER BY final_score DESC, symbol) AS pos,
+           ROW_NUMBER() OVER (PARTITION BY is_active ORDER BY final_score DESC, symbol) AS active_pos
+    FROM latest
+)
+SELECT * FROM ranked
+WHERE pos <= 20 OR (is_active AND active_pos <= 6)
+ORDER BY pos
+"""
+
+_SQL_ACTIVE_SYMBOLS = """
+SELECT DISTINCT ON (symbol) symbol, is_active
+FROM weekly_analysis
+WHERE final_score IS NOT NULL
+ORDER BY symbol, week_start DESC
+"""
+
+# Only touches the row when something changes. found = the symbol has a row
+# that week, changed = the UPDATE actually wrote it.
+_SQL_SET_OVERRIDE = """
+WITH target AS (
+    SELECT 1 FROM weekly_analysis WHERE symbol = $2 AND week_start = $3
+), changed AS (
+    UPDATE weekly_analysis
+    SET is_active = $1, is_manually_overridden = true
+    WHERE symbol = $2 AND week_start = $3
+      AND (is_active IS DISTINCT FROM $1 OR is_manually_overridden IS DISTINCT FROM true)
+    RETURNING 1
+)
+SELECT EXISTS (SELECT 1 FROM target) AS found,
+       EXISTS (SELECT 1 FROM changed) AS changed
+"""
+
+# $2 NULL = all markets. NULL pnl counts as 0, matching the P&L totals elsewhere.
+_SQL_STATS = """
+SELECT COUNT(*) AS trades,
+       COUNT(*) FILTER (WHERE result = 'win') AS wins,
+       COUNT(*) FILTER (WHERE result = 'loss') AS losses,
+       COALESCE(SUM(pnl_percent), 0) AS total_pnl,
+       COALESCE(AVG(COALESCE(pnl_percent, 0)) FILTER (WHERE result = 'win'), 0) AS avg_win,
+       COALESCE(AVG(COALESCE(pnl_percent, 0)) FILTER (WHERE result = 'loss'), 0) AS avg_loss,
+       COALESCE(SUM(pnl_percent) FILTER (WHERE result = 'win'), 0) AS gross_win,
+       COALESCE(SUM(pnl_percent) FILTER (WHERE result = 'loss'), 0) AS gross_loss
+FROM trades
+WHERE result IN ('win', 'loss')
+  AND close_time >= NOW() - $1 * INTERVAL '1 day'
+  AND ($2::text IS NULL OR symbol = $2)
+"""
+
+_SQL_NEWS = """
+SELECT region, event_date, title, impact
+FROM economic_events
+WHERE event_date >= CURRENT_DATE
+ORDER BY event_date, impact DESC
+LIMIT 20
+"""
+
+_SQL_WEEK_TOTALS = """
+SELECT COUNT(*) AS closed,
+       COUNT(*) FILTER (WHERE result = 'win') AS wins,
+       COUNT(*) FILTER (WHERE result = 'loss') AS losses,
+       COALESCE(SUM(pnl_percent), 0) AS pnl
+FROM trades
+WHERE week_start = $1 AND result IN ('win', 'loss')
+"""
+
+_SQL_WEEK_BY_MARKET = """
+SELECT symbol,
+       COALESCE(SUM(pnl_percent), 0) AS pnl,
+       COUNT(*) FILTER (WHERE result = 'win') AS wins,
+       COUNT(*) FILTER (WHERE result = 'loss') AS losses
+FROM trades
+WHERE week_start = $1 AND result IN ('win', 'loss')
+GROUP BY symbol
+ORDER BY pnl DESC, symbol
+"""
+
+_SQL_OPEN_TRADES = """
+SELECT COUNT(*) FROM trades
+WHERE result = 'open'
+"""
+
+# Running total over the 4 reported weeks only (window applied after LIMIT)
+_SQL_WEEKLY_REPORT = """
+WITH recent AS (
+    SELECT week_start,
+           COALESCE(SUM(trades_taken), 0) as total_trades,
+           COALESCE(SUM(wins), 0) as total_wins,
+           COALESCE(SUM(losses), 0) as total_losses,
+           COALESCE(SUM(total_pnl_percent), 0) as total_pnl
+    FROM weekly_results
+    GROUP BY week_start
+    ORDER BY week_start DESC
+    LIMIT 4
+)
+SELECT recent.*,
+       SUM(total_pnl) OVER (ORDER BY week_start) AS cumulative
+FROM recent
+ORDER BY week_start DESC
+"""
+
+_SQL_CONFIG = """
+SELECT
+    (SELECT COUNT(*) FROM weekly_analysis wa
+     WHERE wa.is_active = true
+       AND wa.week_start = (
+           SELECT MAX(week_start) FROM weekly_analysis WHERE final_score IS NOT NULL
+       )) AS active_markets,
+    (SELECT MAX(created_at) FROM weekly_analysis
+     WHERE final_score IS NOT NULL) AS latest
+"""
+
+# Per-user token bucket for DB-backed commands: bursts of up to
+# _RATE_CAPACITY commands, then one more every 1 / refill seconds.
+_RATE_CAPACITY = 5.0
+
+
+def rate_limited(cost: float = 1.0, refill: float = 0.2):
+    """Reject a command when the calling user's token bucket is empty."""
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+            user = update.effective_user
+            if user is not None:
+                now = time.monotonic()
+                tokens, last = self._limiter.get(user.id, (_RATE_CAPACITY, now))
+                tokens = min(_RATE_CAPACITY, tokens + (now - last) * refill)
+                if tokens < cost:
+                    self._limiter[user.id] = (tokens, now)
+                    await update.message.reply_text("Slow down — try again in a few seconds.")
+                    return
+                self._limiter[user.id] = (tokens - cost, now)
+            return await handler(self, update, context)
+
+        return wrapper
+
+    return decorator
+
+
+class _OrjsonRequest(HTTPXRequest):
+    """HTTPXRequest that parses Bot API responses with orjson."""
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # Lenient UTF-8 decode + PTB's error reporting
+            return HTTPXRequest.parse_json_payload(payload)
+
+
+@functools.lru_cache(maxsize=32)
+def _deactivate_markup(symbols: tuple[str, ...]) -> InlineKeyboardMarkup | None:
+    """One 'Deactivate' button per symbol. The active set rarely changes
+    between /markets calls, and PTB markup objects are immutable, so the
+    same instance is reused."""
+    if not symbols:
+        return None
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(f"Deactivate {s}", callback_data=f"override:{s}:off")]
+        for s in symbols
+    ])
+
 
 class LongEntryBot:
     """Interactive Telegram bot for LongEntry Market Scanner."""
@@ -44,50 +249,103 @@ class LongEntryBot:
         self.chat_id = settings.telegram_chat_id
         self.app: Application | None = None
         self._running = False
+        self._notify_task: asyncio.Task | None = None
+        # key -> (expires_at monotonic, value); one lock per key so concurrent
+        # commands share a single refresh instead of stampeding Postgres
+        self._cache: dict[str, tuple[float, object]] = {}
+        self._cache_locks: dict[str, asyncio.Lock] = {}
+        # user id -> (tokens, last refill monotonic), see rate_limited()
+        self._limiter: dict[int, tuple[float, float]] = {}
+        # (symbol, is_active) -> pending override write, see _set_override()
+        self._inflight: dict[tuple[str, bool], asyncio.Future] = {}
 
     async def start(self):
-        """Initialize and start the bot with polling."""
+        """Initialize and start the bot (webhook if configured, else polling)."""
         if not self.token or not self.chat_id:
             logger.warning("Telegram bot not configured — skipping startup")
             return
 
-        self.app = Application.builder().token(self.token).build()
+        self.app = (
+            Application.builder()
+            .token(self.token)
+            .request(_OrjsonRequest(
+                connection_pool_size=20,
+                read_timeout=15,
+                # httpx drops idle connections after 5s by default; notifications
+                # come in bursts minutes apart, so keep the TLS session longer
+                httpx_kwargs={"limits": httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=75,
+                )},
+            ))
+            .get_updates_request(_OrjsonRequest())
+            .build()
+        )
 
-        # Register command handlers
-        self.app.add_handler(CommandHandler("start", self.cmd_start))
-        self.app.add_handler(CommandHandler("help", self.cmd_help))
-        self.app.add_handler(CommandHandler("markets", self.cmd_markets))
-        self.app.add_handler(CommandHandler("scan", self.cmd_scan))
-        self.app.add_handler(CommandHandler("stats", self.cmd_stats))
-        self.app.add_handler(CommandHandler("override", self.cmd_override))
-        self.app.add_handler(CommandHandler("news", self.cmd_news))
-        self.app.add_handler(CommandHandler("drawdown", self.cmd_drawdown))
-        self.app.add_handler(CommandHandler("report", self.cmd_report))
-        self.app.add_handler(CommandHandler("config", self.cmd_config))
+        # Register command handlers. block=False runs each handler as its own
+        # task, so a slow /stats doesn't hold up the next user's /markets.
+        self.app.add_handler(CommandHandler("start", self.cmd_start, block=False))
+        self.app.add_handler(CommandHandler("help", self.cmd_help, block=False))
+        self.app.add_handler(CommandHandler("markets", self.cmd_markets, block=False))
+        self.app.add_handler(CommandHandler("scan", self.cmd_scan, block=False))
+        self.app.add_handler(CommandHandler("stats", self.cmd_stats, block=False))
+        self.app.add_handler(CommandHandler("override", self.cmd_override, block=False))
+        self.app.add_handler(CommandHandler("news", self.cmd_news, block=False))
+        self.app.add_handler(CommandHandler("drawdown", self.cmd_drawdown, block=False))
+        self.app.add_handler(CommandHandler("report", self.cmd_report, block=False))
+        self.app.add_handler(CommandHandler("config", self.cmd_config, block=False))
 
         # Inline button callbacks
-        self.app.add_handler(CallbackQueryHandler(self.handle_callback))
+        self.app.add_handler(CallbackQueryHandler(self.handle_callback, block=False))
 
-        # Start polling (non-blocking)
         await self.app.initialize()
         await self.app.start()
-        await self.app.updater.start_polling(drop_pending_updates=True)
-        self._running = True
-
-        logger.info("Telegram bot started (polling mode)")
+        webhook = bool(settings.telegram_webhook_url)
+        if webhook and not settings.telegram_webhook_secret:
+            # Without the secret the public route can't tell Telegram from a
+            # forged update (e.g. /override), so don't expose it
+            logger.error(
+                "LE_TELEGRAM_WEBHOOK_URL is set without LE_TELEGRAM_WEBHOOK_SECRET"
+                " — falling back to polling"
+            )
+            webhook = False
+        if webhook:
+            # Telegram pushes updates to our FastAPI route; no idle getUpdates
+            await self.app.bot.set_webhook(
+                url=settings.telegram_webhook_url,
+                secret_token=settings.telegram_webhook_secret,
+                drop_pending_updates=True,
+            )
+            self._running = True
+            logger.info("Telegram bot started (webhook mode)")
+        else:
+            await self.app.updater.start_polling(drop_pending_updates=True)
+            self._running = True
+            logger.info("Telegram bot started (polling mode)")
 
         # Start background notification loop
-        asyncio.create_task(self._notification_loop())
+        self._notify_task = asyncio.create_task(self._notification_loop())
 
     async def stop(self):
         """Gracefully stop the bot."""
         if self.app and self._running:
             self._running = False
-            await self.app.updater.stop()
+            if self._notify_task is not None:
+                # Sleeps until the next summary is due, so don't wait it out
+                self._notify_task.cancel()
+                self._notify_task = None
+            if self.app.updater.running:
+                await self.app.updater.stop()
             await self.app.stop()
             await self.app.shutdown()
             logger.info("Telegram bot stopped")
 
+    async def enqueue_update(self, data: dict):
+        """Hand a webhook-delivered update to the application's dispatcher."""
+        update = Update.de_json(data, self.app.bot)
+        await self.app.update_queue.put(update)
+
     # ────────────────────────────────────────────────────────────────
     # Helper: Send message to configured chat
     # ────────────────────────────────────────────────────────────────
@@ -116,6 +374,119 @@ class LongEntryBot:
         today = date.today()
         return today - timedelta(days=today.weekday())
 
+    # ────────────────────────────────────────────────────────────────
+    # Helper: Short-lived cache for hot weekly_analysis reads
+    # ────────────────────────────────────────────────────────────────
+
+    async def _cached(self, key: str, ttl: float, factory):
+        """Return the cached value for key, refreshing via factory() once expired."""
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another waiter may have refreshed while we queued for the lock
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                return hit[1]
+            value = await factory()
+            self._cache[key] = (time.monotonic() + ttl, value)
+            return value
+
+    def _invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.pop(key, None)
+
+    async def _latest_week_start(self) -> date | None:
+        async def fetch():
+            pool = await get_pool()
+            async with pool.acquire() as conn:
+                return await conn.fetchval(_SQL_LATEST_WEEK_START)
+
+        return await self._cached("latest_week_start", _CACHE_TTL, fetch)
+
+    async def _market_rankings(self) -> list:
+        async def fetch():
+            pool = await get_pool()
+            async with pool.acquire() as conn:
+                return await conn.fetch(_SQL_MARKET_RANKINGS)
+
+        return await self._cached("market_rankings", _CACHE_TTL, fetch)
+
+    async def _active_symbols(self) -> list[str]:
+        async def fetch():
+            pool = await get_pool()
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(_SQL_ACTIVE_SYMBOLS)
+            return [r["symbol"] for r in rows if r["is_active"]]
+
+        return await self._cached("active_symbols", _CACHE_TTL, fetch)
+
+    async def _set_override(self, symbol: str, is_active: bool) -> OverrideOutcome | None:
+        """Manually (de)activate symbol for the latest analysed week.
+
+        Returns "changed" if the row was written, "unchanged" if it was
+        already in that state, "missing" if the symbol has no row that week,
+        and None if there is no analysis at all.
+
+        Concurrent identical requests (a double-tapped inline button) share
+        the first call's result instead of issuing the UPDATE again.
+        """
+        key = (symbol, is_active)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await self._write_override(symbol, is_active)
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; waiters see a cancelled future
+            # rather than a CancelledError stored as the write's outcome
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def _write_override(self, symbol: str, is_active: bool) -> OverrideOutcome | None:
+        ws = await self._latest_week_start()
+        if not ws:
+            return None
+        pool = await get_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                _SQL_SET_OVERRIDE,
+                is_active,
+                symbol,
+                ws,
+            )
+        if not row["found"]:
+            return "missing"
+        if not row["changed"]:
+            return "unchanged"
+        self._invalidate("market_rankings", "active_symbols")
+        return "changed"
+
+    @staticmethod
+    def _override_reply(symbol: str, is_active: bool, outcome: OverrideOutcome) -> str:
+        # /override echoes whatever the user typed, so escape it for HTML
+        name = html.escape(symbol)
+        if outcome == "missing":
+            return f"❓ <b>{name}</b> is not in this week's analysis"
+        if outcome == "unchanged":
+            state = "active" if is_active else "inactive"
+            return f"ℹ️ <b>{name}</b> is already {state}"
+        status = "ACTIVATED" if is_active else "DEACTIVATED"
+        return f"✅ <b>{name}</b> {status} (manual override)"
+
     # ────────────────────────────────────────────────────────────────
     # Command: /start
     # ────────────────────────────────────────────────────────────────
@@ -151,35 +522,26 @@ class LongEntryBot:
     # Command: /markets
     # ────────────────────────────────────────────────────────────────
 
+    @rate_limited()
     async def cmd_markets(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        pool = await get_pool()
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT DISTINCT ON (wa.symbol) wa.symbol, wa.final_score,
-                       wa.technical_score, wa.backtest_score, wa.fundamental_score,
-                       wa.ai_score, wa.ai_confidence, wa.ai_bias,
-                       wa.is_active, wa.is_manually_overridden, wa.rank,
-                       m.category, m.name
-                FROM weekly_analysis wa
-                JOIN markets m ON m.symbol = wa.symbol
-                WHERE wa.final_score IS NOT NULL AND m.is_in_universe = true
-                ORDER BY wa.symbol, wa.week_start DESC
-                """
-            )
+        rows = await self._market_rankings()
 
         if not rows:
             await update.message.reply_text("No analysis data available yet.")
             return
 
-        # Sort by final score descending
-        sorted_rows = sorted(rows, key=lambda r: r["final_score"] or 0, reverse=True)
-
         lines = ["<b>Market Rankings</b>\n"]
-
-        for r in sorted_rows[:20]:  # Top 20
+        button_symbols: list[str] = []
+
+        # One pass: top 20 become lines, top 6 active get deactivate buttons.
+        # Rows arrive sorted by score; past the top 20 are only button rows.
+        for r in rows:
+            if r["is_active"] and r["active_pos"] <= 6:
+                button_symbols.append(r["symbol"])
+            if r["pos"] > 20:
+                continue
             symbol = r["symbol"]
-            score = r["final_score"] or 0
+            score = r["final_score"]
             active = r["is_active"]
             override = r["is_manually_overridden"]
             rank = r["rank"] or "?"
@@ -196,7 +558,7 @@ class LongEntryBot:
             if r["ai_score"] is not None:
                 confidence = (r["ai_confidence"] or "?").upper()
                 bias = r["ai_bias"] or "?"
-                bias_emoji = {"bullish": "↑", "bearish": "↓", "neutral": "→"}.get(bias, "?")
+                bias_emoji = _BIAS_EMOJI.get(bias, "?")
                 ai_tag = f" [{confidence} {bias_emoji}]"
             else:
                 ai_tag = ""
@@ -205,18 +567,7 @@ class LongEntryBot:
                 f"{icon} #{rank} <b>{symbol}</b> — {score:.0f}{ai_tag} ({status})"
             )
 
-        # Add inline buttons for top active markets
-        keyboard = []
-        active_markets = [r for r in sorted_rows if r["is_active"]][:6]
-        for r in active_markets:
-            keyboard.append([
-                InlineKeyboardButton(
-                    f"Deactivate {r['symbol']}",
-                    callback_data=f"override:{r['symbol']}:off",
-                )
-            ])
-
-        reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
+        reply_markup = _deactivate_markup(tuple(button_symbols))
         await update.message.reply_text("\n".join(lines), parse_mode="HTML",
                                         reply_markup=reply_markup)
 
@@ -236,6 +587,7 @@ class LongEntryBot:
     # Command: /stats [SYMBOL] [DAYS]
     # ────────────────────────────────────────────────────────────────
 
+    @rate_limited()
     async def cmd_stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         args = context.args or []
         symbol = args[0].upper() if len(args) >= 1 else None
@@ -243,45 +595,27 @@ class LongEntryBot:
 
         pool = await get_pool()
         async with pool.acquire() as conn:
-            if symbol:
-                trades = await conn.fetch(
-                    """
-                    SELECT result, pnl_percent FROM trades
-                    WHERE symbol = $1 AND result IN ('win', 'loss')
-                      AND close_time >= NOW() - $2 * INTERVAL '1 day'
-                    ORDER BY close_time DESC
-                    """,
-                    symbol,
-                    days,
-                )
-            else:
-                trades = await conn.fetch(
-                    """
-                    SELECT symbol, result, pnl_percent FROM trades
-                    WHERE result IN ('win', 'loss')
-                      AND close_time >= NOW() - $1 * INTERVAL '1 day'
-                    ORDER BY close_time DESC
-                    """,
-                    days,
-                )
+            stats = await conn.fetchrow(_SQL_STATS, days, symbol)
 
+        trades = stats["trades"]
         if not trades:
             title = f"{symbol} " if symbol else ""
             await update.message.reply_text(f"No trades found for {title}last {days} days.")
             return
 
-        wins = [t for t in trades if t["result"] == "win"]
-        losses = [t for t in trades if t["result"] == "loss"]
-        total_pnl = sum(t["pnl_percent"] or 0 for t in trades)
-        win_rate = len(wins) / len(trades) * 100 if trades else 0
-        avg_win = sum(t["pnl_percent"] or 0 for t in wins) / len(wins) if wins else 0
-        avg_loss = sum(t["pnl_percent"] or 0 for t in losses) / len(losses) if losses else 0
-        pf = abs(sum(t["pnl_percent"] or 0 for t in wins) / sum(t["pnl_percent"] or 0 for t in losses)) if losses and sum(t["pnl_percent"] or 0 for t in losses) != 0 else 0
+        wins = stats["wins"]
+        losses = stats["losses"]
+        total_pnl = stats["total_pnl"]
+        win_rate = wins / trades * 100
+        avg_win = stats["avg_win"]
+        avg_loss = stats["avg_loss"]
+        gross_loss = stats["gross_loss"]
+        pf = abs(stats["gross_win"] / gross_loss) if gross_loss != 0 else 0
 
         title = f"<b>{symbol}</b>" if symbol else "<b>All Markets</b>"
         text = (
             f"{title} (Last {days} days)\n"
-            f"├─ Trades: {len(trades)} ({len(wins)}W / {len(losses)}L)\n"
+            f"├─ Trades: {trades} ({wins}W / {losses}L)\n"
             f"├─ Win rate: {win_rate:.1f}%\n"
             f"├─ Avg winner: {avg_win:+.2f}%\n"
             f"├─ Avg loser: {avg_loss:+.2f}%\n"
@@ -311,34 +645,13 @@ class LongEntryBot:
 
         is_active = action == "on"
 
-        pool = await get_pool()
-        async with pool.acquire() as conn:
-            # Get effective week
-            ws = await conn.fetchval(
-                """
-                SELECT DISTINCT week_start FROM weekly_analysis
-                WHERE final_score IS NOT NULL
-                ORDER BY week_start DESC LIMIT 1
-                """
-            )
-            if not ws:
-                await update.message.reply_text("No analysis data available.")
-                return
-
-            result = await conn.execute(
-                """
-                UPDATE weekly_analysis
-                SET is_active = $1, is_manually_overridden = true
-                WHERE symbol = $2 AND week_start = $3
-                """,
-                is_active,
-                symbol,
-                ws,
-            )
+        outcome = await self._set_override(symbol, is_active)
+        if outcome is None:
+            await update.message.reply_text("No analysis data available.")
+            return
 
-        status = "ACTIVATED" if is_active else "DEACTIVATED"
         await update.message.reply_text(
-            f"✅ <b>{symbol}</b> {status} (manual override)",
+            self._override_reply(symbol, is_active, outcome),
             parse_mode="HTML",
         )
 
@@ -349,15 +662,7 @@ class LongEntryBot:
     async def cmd_news(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         pool = await get_pool()
         async with pool.acquire() as conn:
-            events = await conn.fetch(
-                """
-                SELECT region, event_date, title, impact
-                FROM economic_events
-                WHERE event_date >= CURRENT_DATE
-                ORDER BY event_date, impact DESC
-                LIMIT 20
-                """
-            )
+            events = await conn.fetch(_SQL_NEWS)
 
         if not events:
             await update.message.reply_text("No upcoming economic events.")
@@ -365,7 +670,7 @@ class LongEntryBot:
 
         lines = ["<b>Upcoming Economic Events</b>\n"]
         for e in events:
-            impact_icon = {"high": "🔴", "medium": "🟠", "low": "🟡"}.get(e["impact"], "⚪")
+            impact_icon = _IMPACT_ICON.get(e["impact"], "⚪")
             dt = e["event_date"].strftime("%a %b %d")
             lines.append(f"{impact_icon} {dt} — {e['title']} ({e['region']})")
 
@@ -375,84 +680,57 @@ class LongEntryBot:
     # Command: /drawdown
     # ────────────────────────────────────────────────────────────────
 
+    @rate_limited()
     async def cmd_drawdown(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         ws = self._week_start()
         pool = await get_pool()
-        async with pool.acquire() as conn:
-            # Active markets
-            active = await conn.fetch(
-                """
-                SELECT DISTINCT ON (symbol) symbol, is_active
-                FROM weekly_analysis
-                WHERE final_score IS NOT NULL
-                ORDER BY symbol, week_start DESC
-                """
-            )
-            active_symbols = [r["symbol"] for r in active if r["is_active"]]
-
-            # Weekly trades
-            trades = await conn.fetch(
-                """
-                SELECT symbol, result, pnl_percent
-                FROM trades
-                WHERE week_start = $1 AND result IN ('win', 'loss')
-                """,
-                ws,
-            )
 
-            # Open trades
-            open_trades = await conn.fetchval(
-                """
-                SELECT COUNT(*) FROM trades
-                WHERE result = 'open'
-                """
-            )
+        # Independent reads: each takes its own pool connection so the
+        # round-trips overlap instead of queueing on one connection
+        async def week_by_market():
+            async with pool.acquire() as conn:
+                return await conn.fetch(_SQL_WEEK_BY_MARKET, ws)
 
-        weekly_pnl = sum(t["pnl_percent"] or 0 for t in trades)
-        weekly_wins = sum(1 for t in trades if t["result"] == "win")
-        weekly_losses = sum(1 for t in trades if t["result"] == "loss")
+        async def open_count():
+            async with pool.acquire() as conn:
+                return await conn.fetchval(_SQL_OPEN_TRADES)
 
-        text = (
-            f"<b>This Week ({ws.strftime('%b %d')} - {(ws + timedelta(days=4)).strftime('%b %d')})</b>\n"
-            f"├─ Active Markets: {len(active_symbols)}\n"
-            f"├─ Open Trades: {open_trades or 0}\n"
-            f"├─ Closed: {len(trades)} ({weekly_wins}W / {weekly_losses}L)\n"
-            f"└─ Weekly P&L: {weekly_pnl:+.2f}%"
+        active_symbols, markets, open_trades = await asyncio.gather(
+            self._active_symbols(), week_by_market(), open_count()
         )
 
-        # Per-market breakdown
-        if trades:
-            text += "\n\n<b>By Market:</b>"
-            market_pnl = {}
-            for t in trades:
-                s = t["symbol"]
-                market_pnl[s] = market_pnl.get(s, 0) + (t["pnl_percent"] or 0)
-            for s, pnl in sorted(market_pnl.items(), key=lambda x: x[1], reverse=True):
+        # One row per traded market, so totals are a short sum, not a trade scan
+        weekly_pnl = sum(m["pnl"] for m in markets)
+        weekly_wins = sum(m["wins"] for m in markets)
+        weekly_losses = sum(m["losses"] for m in markets)
+
+        lines = [
+            f"<b>This Week ({ws.strftime('%b %d')} - {(ws + timedelta(days=4)).strftime('%b %d')})</b>",
+            f"├─ Active Markets: {len(active_symbols)}",
+            f"├─ Open Trades: {open_trades}",
+            f"├─ Closed: {weekly_wins + weekly_losses} ({weekly_wins}W / {weekly_losses}L)",
+            f"└─ Weekly P&L: {weekly_pnl:+.2f}%",
+        ]
+
+        # Per-market breakdown (already grouped and sorted by P&L in SQL)
+        if markets:
+            lines.append("\n<b>By Market:</b>")
+            for m in markets:
+                pnl = m["pnl"]
                 emoji = "🟢" if pnl >= 0 else "🔴"
-                text += f"\n  {emoji} {s}: {pnl:+.2f}%"
+                lines.append(f"  {emoji} {m['symbol']}: {pnl:+.2f}%")
 
-        await update.message.reply_text(text, parse_mode="HTML")
+        await update.message.reply_text("\n".join(lines), parse_mode="HTML")
 
     # ────────────────────────────────────────────────────────────────
     # Command: /report
     # ────────────────────────────────────────────────────────────────
 
+    @rate_limited()
     async def cmd_report(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         pool = await get_pool()
         async with pool.acquire() as conn:
-            weeks = await conn.fetch(
-                """
-                SELECT week_start,
-                       SUM(trades_taken) as total_trades,
-                       SUM(wins) as total_wins,
-                       SUM(losses) as total_losses,
-                       SUM(total_pnl_percent) as total_pnl
-                FROM weekly_results
-                GROUP BY week_start
-                ORDER BY week_start DESC
-                LIMIT 4
-                """
-            )
+            weeks = await conn.fetch(_SQL_WEEKLY_REPORT)
 
         if not weeks:
             await update.message.reply_text("No weekly results available yet.")
@@ -460,19 +738,17 @@ class LongEntryBot:
 
         lines = ["<b>Weekly Performance Report</b>\n"]
 
-        cumulative = 0
         for w in reversed(weeks):
             ws = w["week_start"].strftime("%b %d")
-            trades = w["total_trades"] or 0
-            wins = w["total_wins"] or 0
-            losses = w["total_losses"] or 0
-            pnl = w["total_pnl"] or 0
-            cumulative += pnl
+            trades = w["total_trades"]
+            wins = w["total_wins"]
+            losses = w["total_losses"]
+            pnl = w["total_pnl"]
             wr = (wins / trades * 100) if trades > 0 else 0
             emoji = "🟢" if pnl >= 0 else "🔴"
             lines.append(f"{emoji} {ws}: {pnl:+.2f}% ({trades}T, {wr:.0f}%WR)")
 
-        lines.append(f"\n<b>Cumulative (4 weeks): {cumulative:+.2f}%</b>")
+        lines.append(f"\n<b>Cumulative (4 weeks): {weeks[0]['cumulative']:+.2f}%</b>")
 
         await update.message.reply_text("\n".join(lines), parse_mode="HTML")
 
@@ -480,28 +756,20 @@ class LongEntryBot:
     # Command: /config
     # ────────────────────────────────────────────────────────────────
 
+    @rate_limited()
     async def cmd_config(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         pool = await get_pool()
         async with pool.acquire() as conn:
-            active_markets = await conn.fetchval(
-                """
-                SELECT COUNT(*) FROM weekly_analysis wa
-                WHERE wa.is_active = true
-                  AND wa.week_start = (
-                      SELECT MAX(week_start) FROM weekly_analysis WHERE final_score IS NOT NULL
-                  )
-                """
-            )
-            latest = await conn.fetchval(
-                "SELECT MAX(created_at) FROM weekly_analysis WHERE final_score IS NOT NULL"
-            )
+            row = await conn.fetchrow(_SQL_CONFIG)
+        active_markets = row["active_markets"]
+        latest = row["latest"]
 
         ai_status = "ENABLED" if settings.ai_vision_enabled else "DISABLED"
         latest_str = latest.strftime("%a %b %d %H:%M UTC") if latest else "Never"
 
         text = (
             "<b>Configuration</b>\n"
-            f"├─ Max Active Markets: {settings.max_active_markets} ({active_markets or 0} active)\n"
+            f"├─ Max Active Markets: {settings.max_active_markets} ({active_markets} active)\n"
             f"├─ Min Final Score: {settings.min_final_score}\n"
             f"├─ AI Vision: {ai_status}\n"
             f"├─ Last Analysis: {latest_str}\n"
@@ -525,30 +793,13 @@ class LongEntryBot:
                 action = parts[2]
                 is_active = action == "on"
 
-                pool = await get_pool()
-                async with pool.acquire() as conn:
-                    ws = await conn.fetchval(
-                        """
-                        SELECT DISTINCT week_start FROM weekly_analysis
-                        WHERE final_score IS NOT NULL
-                        ORDER BY week_start DESC LIMIT 1
-                        """
-                    )
-                    if ws:
-                        await conn.execute(
-                            """
-                            UPDATE weekly_analysis
-                            SET is_active = $1, is_manually_overridden = true
-                            WHERE symbol = $2 AND week_start = $3
-                            """,
-                            is_active,
-                            symbol,
-                            ws,
-                        )
-
-                status = "ACTIVATED" if is_active else "DEACTIVATED"
+                outcome = await self._set_override(symbol, is_active)
+                if outcome is None:
+                    await query.edit_message_text("No analysis data available.")
+                    return
+
                 await query.edit_message_text(
-                    f"✅ <b>{symbol}</b> {status} (manual override)",
+                    self._override_reply(symbol, is_active, outcome),
                     parse_mode="HTML",
                 )
 
@@ -556,54 +807,58 @@ class LongEntryBot:
     # Background notification loop
     # ────────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _next_daily_summary(now: datetime, last_sent: date | None) -> datetime:
+        """When the next daily summary is due: weekdays at 19:00 UTC.
+
+        Today's slot stays due until 20:00 so a restart during the 19:00 hour
+        still sends it, as the old minute-polling loop did.
+        """
+        target = now.replace(hour=19, minute=0, second=0, microsecond=0)
+        if target.weekday() < 5 and target.date() != last_sent and now.hour < 20:
+            return target
+        target += timedelta(days=1)
+        while target.weekday() >= 5:
+            target += timedelta(days=1)
+        return target
+
     async def _notification_loop(self):
         """Run scheduled notifications in the background."""
         last_daily_summary = None
 
         while self._running:
             try:
+                # Daily P&L summary — sleep until it's due rather than polling
                 now = datetime.now(timezone.utc)
+                due = self._next_daily_summary(now, last_daily_summary)
+                delay = (due - now).total_seconds()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
 
-                # Daily P&L summary — weekdays at 19:00 UTC
-                if (
-                    now.weekday() < 5
-                    and now.hour == 19
-                    and last_daily_summary != now.date()
-                ):
-                    last_daily_summary = now.date()
-                    await self._send_daily_summary()
+                last_daily_summary = now.date()
+                await self._send_daily_summary()
 
             except Exception:
                 logger.exception("Notification loop error")
-
-            await asyncio.sleep(60)  # Check every minute
+                await asyncio.sleep(60)
 
     async def _send_daily_summary(self):
         """Send end-of-day P&L summary."""
         ws = self._week_start()
         pool = await get_pool()
         async with pool.acquire() as conn:
-            trades = await conn.fetch(
-                """
-                SELECT symbol, result, pnl_percent
-                FROM trades
-                WHERE week_start = $1 AND result IN ('win', 'loss')
-                """,
-                ws,
-            )
+            totals = await conn.fetchrow(_SQL_WEEK_TOTALS, ws)
 
-        if not trades:
+        if not totals["closed"]:
             return
 
-        weekly_pnl = sum(t["pnl_percent"] or 0 for t in trades)
-        wins = sum(1 for t in trades if t["result"] == "win")
-        losses = sum(1 for t in trades if t["result"] == "loss")
         today = date.today().strftime("%b %d")
 
         text = (
             f"📊 <b>Daily Summary ({today})</b>\n"
-            f"├─ Closed this week: {len(trades)} ({wins}W / {losses}L)\n"
-            f"└─ Weekly P&L: {weekly_pnl:+.2f}%"
+            f"├─ Closed this week: {totals['closed']} ({totals['wins']}W / {totals['losses']}L)\n"
+            f"└─ Weekly P&L: {totals['pnl']:+.2f}%"
         )
         await self.send(text)
 
@@ -633,4 +888,4 @@ async def send_notification(text: str):
     else:
         # Fallback to simple HTTP POST (same as old telegram.py)
         from app.telegram import send_message
-        send_message(text)
+        await send_message(text)
@@ -0,0 +1,10 @@
+-- Content-addressed screenshot storage
+-- Run with: psql -U longentry -d longentry -f 008_screenshot_content_hash.sql
+
+-- SHA-256 of the stored JPEG; the file itself lives once under
+-- screenshots/blobs/<aa>/<bb>/<sha256>.jpg and file_path is a hardlink to it
+ALTER TABLE chart_screenshots
+    ADD COLUMN IF NOT EXISTS content_sha256 CHAR(64);
+
+CREATE INDEX IF NOT EXISTS idx_screenshots_sha256
+    ON chart_screenshots(content_sha256);
@@ -0,0 +1,19 @@
+-- Latest candle per symbol, maintained by POST /api/candles
+-- Run with: psql -U longentry -d longentry -f 009_latest_candles.sql
+
+-- Lets GET /api/markets join ~14 rows instead of probing candles per market
+CREATE TABLE IF NOT EXISTS latest_candles (
+    symbol VARCHAR(20) PRIMARY KEY,
+    close DOUBLE PRECISION NOT NULL,
+    open_time TIMESTAMP NOT NULL
+);
+
+-- Backfill from existing candle data
+INSERT INTO latest_candles (symbol, close, open_time)
+SELECT DISTINCT ON (symbol) symbol, close, open_time
+FROM candles
+ORDER BY symbol, open_time DESC
+ON CONFLICT (symbol) DO UPDATE SET
+    close = EXCLUDED.close,
+    open_time = EXCLUDED.open_time
+WHERE latest_candles.open_time < EXCLUDED.open_time;
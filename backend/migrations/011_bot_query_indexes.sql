@@ -0,0 +1,18 @@
+-- Indexes for the Telegram bot's recurring queries
+-- Run with: psql -U longentry -d longentry -f 011_bot_query_indexes.sql
+
+-- CONCURRENTLY keeps weekly_analysis / trades writable while the indexes
+-- build; it can't run inside a transaction, so don't wrap this file in one.
+
+-- "Latest analysis per symbol": SELECT DISTINCT ON (symbol) ...
+-- ORDER BY symbol, week_start DESC. The UNIQUE(symbol, week_start) index is
+-- ascending on week_start, so Postgres still sorts; this one matches the order.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_wa_symbol_week_desc
+    ON weekly_analysis(symbol, week_start DESC)
+    WHERE final_score IS NOT NULL;
+
+-- /drawdown and the daily summary aggregate one week's closed trades;
+-- INCLUDE lets those run as index-only scans.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trades_week_result
+    ON trades(week_start, result)
+    INCLUDE (symbol, pnl_percent);
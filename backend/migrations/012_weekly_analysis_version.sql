@@ -0,0 +1,60 @@
+-- Commit-ordered change counter for weekly_analysis
+-- Run with: psql -U longentry -d longentry -f 012_weekly_analysis_version.sql
+
+-- GET /api/analytics keys its response cache on this counter. The counter
+-- row is locked by each writing transaction until it commits, so every
+-- commit that changes weekly_analysis leaves a value no reader has seen,
+-- whatever order the transactions started in.
+CREATE TABLE IF NOT EXISTS weekly_analysis_version (
+    id BOOLEAN PRIMARY KEY DEFAULT true CHECK (id),
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO weekly_analysis_version (id) VALUES (true)
+ON CONFLICT (id) DO NOTHING;
+
+-- Statement-level, but only bumps when the statement touched a row, so a
+-- no-op write (e.g. an /override that changes nothing) doesn't lock the
+-- counter or invalidate the cache.
+CREATE OR REPLACE FUNCTION bump_weekly_analysis_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'TRUNCATE' THEN
+        IF NOT EXISTS (SELECT 1 FROM changed_rows) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+    UPDATE weekly_analysis_version SET version = version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow one event per trigger
+DROP TRIGGER IF EXISTS trg_weekly_analysis_version ON weekly_analysis;
+DROP TRIGGER IF EXISTS trg_weekly_analysis_version_insert ON weekly_analysis;
+CREATE TRIGGER trg_weekly_analysis_version_insert
+    AFTER INSERT ON weekly_analysis
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_weekly_analysis_version();
+
+DROP TRIGGER IF EXISTS trg_weekly_analysis_version_update ON weekly_analysis;
+CREATE TRIGGER trg_weekly_analysis_version_update
+    AFTER UPDATE ON weekly_analysis
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_weekly_analysis_version();
+
+DROP TRIGGER IF EXISTS trg_weekly_analysis_version_delete ON weekly_analysis;
+CREATE TRIGGER trg_weekly_analysis_version_delete
+    AFTER DELETE ON weekly_analysis
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_weekly_analysis_version();
+
+DROP TRIGGER IF EXISTS trg_weekly_analysis_version_truncate ON weekly_analysis;
+CREATE TRIGGER trg_weekly_analysis_version_truncate
+    AFTER TRUNCATE ON weekly_analysis
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_weekly_analysis_version();
+
+-- The updated_at column and per-row trigger from the earlier cache key are
+-- no longer read by anything; remove them where they were installed.
+DROP TRIGGER IF EXISTS trg_weekly_analysis_updated_at ON weekly_analysis;
+DROP FUNCTION IF EXISTS set_updated_at();
+ALTER TABLE weekly_analysis DROP COLUMN IF EXISTS updated_at;
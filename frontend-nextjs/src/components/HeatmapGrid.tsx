@@ -1,6 +1,6 @@
 "use client";
 
-import { HeatmapData, HeatmapCell } from "@/lib/types";
+import { HeatmapData } from "@/lib/types";
 import { useMemo } from "react";
 
 interface HeatmapGridProps {
@@ -33,54 +33,34 @@ function interpolateColor(
 }
 
 export default function HeatmapGrid({ heatmapData }: HeatmapGridProps) {
+  const grid = heatmapData.grid;
+  const slPercentages = grid.sl_pcts;
+  const tpPercentages = grid.tp_pcts;
+
   const stats = useMemo(() => {
-    const returns = heatmapData.grid.map((cell) => cell.total_return);
-    const min = returns.length > 0 ? Math.min(...returns) : 0;
-    const max = returns.length > 0 ? Math.max(...returns) : 0;
+    let min = Infinity;
+    let max = -Infinity;
 
-    // Find optimal cell (highest return)
-    let optimalCell: HeatmapCell | null = null;
-    let maxReturn = -Infinity;
-    for (const cell of heatmapData.grid) {
-      if (cell.total_return > maxReturn) {
-        maxReturn = cell.total_return;
-        optimalCell = cell;
+    // Find optimal cell (highest return) as [sl index, tp index]
+    let optimal: [number, number] | null = null;
+    for (let i = 0; i < grid.total_return.length; i++) {
+      const row = grid.total_return[i];
+      for (let j = 0; j < row.length; j++) {
+        if (row[j] < min) min = row[j];
+        if (row[j] > max) {
+          max = row[j];
+          optimal = [i, j];
+        }
       }
     }
 
-    return { min, max, optimalCell };
-  }, [heatmapData.grid]);
-
-  // Get unique SL and TP percentages
-  const slPercentages = useMemo(() => {
-    const unique = new Set(heatmapData.grid.map((cell) => cell.sl_pct));
-    return Array.from(unique).sort((a, b) => a - b);
-  }, [heatmapData.grid]);
-
-  const tpPercentages = useMemo(() => {
-    const unique = new Set(heatmapData.grid.map((cell) => cell.tp_pct));
-    return Array.from(unique).sort((a, b) => a - b);
-  }, [heatmapData.grid]);
-
-  // Build grid map for quick lookup
-  const gridMap = useMemo(() => {
-    const map: Record<string, HeatmapCell> = {};
-    for (const cell of heatmapData.grid) {
-      const key = `${cell.sl_pct}_${cell.tp_pct}`;
-      map[key] = cell;
-    }
-    return map;
-  }, [heatmapData.grid]);
-
-  const getCell = (slPct: number, tpPct: number): HeatmapCell | undefined => {
-    return gridMap[`${slPct}_${tpPct}`];
-  };
+    if (optimal === null) return { min: 0, max: 0, optimal };
+    return { min, max, optimal };
+  }, [grid]);
+  const optimal = stats.optimal;
 
-  const isOptimal =
-    (slPct: number, tpPct: number) =>
-      stats.optimalCell &&
-      stats.optimalCell.sl_pct === slPct &&
-      stats.optimalCell.tp_pct === tpPct;
+  const isOptimal = (i: number, j: number) =>
+    optimal !== null && optimal[0] === i && optimal[1] === j;
 
   return (
     <div className="space-y-6">
@@ -102,7 +82,7 @@ export default function HeatmapGrid({ heatmapData }: HeatmapGridProps) {
           </div>
 
           {/* Grid Rows */}
-          {slPercentages.map((sl) => (
+          {slPercentages.map((sl, i) => (
             <div key={`sl-${sl}`} className="flex">
               {/* Row Header (SL percentage) */}
               <div
@@ -118,54 +98,43 @@ export default function HeatmapGrid({ heatmapData }: HeatmapGridProps) {
               </div>
 
               {/* Data Cells */}
-              {tpPercentages.map((tp) => {
-                const cell = getCell(sl, tp);
-                const isOpt = isOptimal(sl, tp);
+              {tpPercentages.map((tp, j) => {
+                const totalReturn = grid.total_return[i][j];
+                const winRate = grid.win_rate[i][j];
+                const isOpt = isOptimal(i, j);
 
                 return (
                   <div
                     key={`cell-${sl}-${tp}`}
                     className="w-24 flex-shrink-0 flex items-center justify-center py-4 px-2 transition-all"
                     style={{
-                      backgroundColor: cell
-                        ? interpolateColor(cell.total_return, stats.min, stats.max)
-                        : "var(--bg-surface)",
+                      backgroundColor: interpolateColor(totalReturn, stats.min, stats.max),
                       border: isOpt
                         ? `3px solid var(--accent-blue)`
                         : `1px solid var(--border)`,
-                      cursor: cell ? "pointer" : "default",
+                      cursor: "pointer",
                     }}
-                    title={
-                      cell
-                        ? `SL: ${cell.sl_pct.toFixed(1)}%, TP: ${cell.tp_pct.toFixed(
-                            1
-                          )}%\nReturn: ${cell.total_return.toFixed(2)}%\nWin Rate: ${cell.win_rate.toFixed(
-                            1
-                          )}%\nTrades: ${cell.total_trades}`
-                        : undefined
-                    }
+                    title={`SL: ${sl.toFixed(1)}%, TP: ${tp.toFixed(
+                      1
+                    )}%\nReturn: ${totalReturn.toFixed(2)}%\nWin Rate: ${winRate.toFixed(
+                      1
+                    )}%\nTrades: ${grid.total_trades[i][j]}`}
                   >
-                    {cell && (
-                      <div className="text-center">
-                        <div
-                          className="text-xs font-bold"
-                          style={{
-                            color: cell.total_return >= 0
-                              ? "var(--text-heading)"
-                              : "var(--text-heading)",
-                          }}
-                        >
-                          {cell.total_return >= 0 ? "+" : ""}
-                          {cell.total_return.toFixed(1)}%
-                        </div>
-                        <div
-                          className="text-xs"
-                          style={{ color: "var(--text-muted)" }}
-                        >
-                          {cell.win_rate.toFixed(0)}% WR
-                        </div>
+                    <div className="text-center">
+                      <div
+                        className="text-xs font-bold"
+                        style={{ color: "var(--text-heading)" }}
+                      >
+                        {totalReturn >= 0 ? "+" : ""}
+                        {totalReturn.toFixed(1)}%
                       </div>
-                    )}
+                      <div
+                        className="text-xs"
+                        style={{ color: "var(--text-muted)" }}
+                      >
+                        {winRate.toFixed(0)}% WR
+                      </div>
+                    </div>
                   </div>
                 );
               })}
@@ -197,7 +166,7 @@ export default function HeatmapGrid({ heatmapData }: HeatmapGridProps) {
           />
           <span style={{ color: "var(--text-muted)" }}>Positive</span>
         </div>
-        {stats.optimalCell && (
+        {optimal && (
           <div className="flex items-center gap-2">
             <div
               className="w-4 h-4 rounded"
@@ -290,7 +259,7 @@ export default function HeatmapGrid({ heatmapData }: HeatmapGridProps) {
       )}
 
       {/* Optimal Cell Info */}
-      {stats.optimalCell && (
+      {optimal && (
         <div
           className="rounded-lg p-4"
           style={{
@@ -303,11 +272,11 @@ export default function HeatmapGrid({ heatmapData }: HeatmapGridProps) {
             style={{ color: "var(--accent-blue)" }}
             className="text-sm font-medium"
           >
-            Optimal Parameters: SL {stats.optimalCell.sl_pct.toFixed(1)}% / TP{" "}
-            {stats.optimalCell.tp_pct.toFixed(1)}% = +
-            {stats.optimalCell.total_return.toFixed(2)}% ({" "}
-            {stats.optimalCell.total_trades} trades, {" "}
-            {stats.optimalCell.win_rate.toFixed(1)}% win rate )
+            Optimal Parameters: SL {grid.sl_pcts[optimal[0]].toFixed(1)}% / TP{" "}
+            {grid.tp_pcts[optimal[1]].toFixed(1)}% = +
+            {grid.total_return[optimal[0]][optimal[1]].toFixed(2)}% ({" "}
+            {grid.total_trades[optimal[0]][optimal[1]]} trades, {" "}
+            {grid.win_rate[optimal[0]][optimal[1]].toFixed(1)}% win rate )
           </p>
         </div>
       )}
@@ -403,25 +403,26 @@ export interface WeeklyScoreRecord {
 
 export interface HistoryPoint extends WeeklyScoreRecord {}
 
-export interface HeatmapCell {
-  sl_pct: number;
-  tp_pct: number;
-  total_return: number;
-  win_rate: number;
-  profit_factor: number;
-  total_trades: number;
-}
-
 export interface HourReturn {
   hour: number;
   total_return: number;
   win_rate: number;
 }
 
+// SL x TP backtest grid as parallel arrays; metric[i][j] is sl_pcts[i], tp_pcts[j]
+export interface HeatmapMatrix {
+  sl_pcts: number[];
+  tp_pcts: number[];
+  total_return: number[][];
+  win_rate: number[][];
+  profit_factor: number[][];
+  total_trades: number[][];
+}
+
 export interface HeatmapResponse {
   symbol: string;
   entry_hour: number;
-  grid: HeatmapCell[];
+  grid: HeatmapMatrix;
   entry_hour_returns: HourReturn[];
 }
 
@@ -465,15 +465,12 @@ function Heatmap({ symbol }) {
 
   if (!data) return null;
 
-  // Build grid matrix
-  const slValues = [...new Set(data.grid.map((c) => c.sl_pct))].sort((a, b) => a - b);
-  const tpValues = [...new Set(data.grid.map((c) => c.tp_pct))].sort((a, b) => a - b);
-  const cellMap = {};
-  for (const c of data.grid) {
-    cellMap[`${c.sl_pct}_${c.tp_pct}`] = c;
-  }
+  // Grid matrices are indexed [sl][tp]
+  const { grid } = data;
+  const slValues = grid.sl_pcts;
+  const tpValues = grid.tp_pcts;
 
-  const values = data.grid.map((c) => c[metric]);
+  const values = grid[metric].flat();
   const minVal = Math.min(...values);
   const maxVal = Math.max(...values);
   const range = maxVal - minVal || 1;
@@ -520,19 +517,17 @@ function Heatmap({ symbol }) {
             </tr>
           </thead>
           <tbody>
-            {slValues.map((sl) => (
+            {slValues.map((sl, i) => (
               <tr key={sl}>
                 <td className="px-2 py-1 text-th-muted font-mono">{sl}%</td>
-                {tpValues.map((tp) => {
-                  const cell = cellMap[`${sl}_${tp}`];
-                  if (!cell) return <td key={tp} className="px-2 py-1" />;
-                  const val = cell[metric];
+                {tpValues.map((tp, j) => {
+                  const val = grid[metric][i][j];
                   return (
                     <td
                       key={tp}
                       className="px-2 py-1 text-center font-mono text-th-heading rounded"
                       style={{ backgroundColor: cellColor(val) }}
-                      title={`SL ${sl}% / TP ${tp}%: Return ${cell.total_return}%, WR ${cell.win_rate}%, PF ${cell.profit_factor}`}
+                      title={`SL ${sl}% / TP ${tp}%: Return ${grid.total_return[i][j]}%, WR ${grid.win_rate[i][j]}%, PF ${grid.profit_factor[i][j]}`}
                     >
                       {metric === "total_return" ? `${val >= 0 ? "+" : ""}${val.toFixed(0)}` :
                        metric === "win_rate" ? `${val.toFixed(0)}` :